@@ -5,6 +5,7 @@ Implements binary, explicit, revocable consent mechanisms.
 Consent is the foundational architecture—not a feature.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -48,6 +49,8 @@ class ConsentManager:
         self._consent_map: dict[tuple[str, str, str], ConsentState] = {}
         # History of all consent actions
         self._history: list[ConsentAction] = []
+        # Map entity -> positions in _history where it is sender or receiver
+        self._by_entity: defaultdict[str, list[int]] = defaultdict(list)
         # Track entities that have ever interacted
         self._entities: set[str] = set()
 
@@ -73,7 +76,7 @@ class ConsentManager:
         self._entities.add(entity_from)
         self._entities.add(entity_to)
 
-        self._history.append(
+        self._record(
             ConsentAction(
                 entity_from=entity_from,
                 entity_to=entity_to,
@@ -101,7 +104,7 @@ class ConsentManager:
         key = (entity_from, entity_to, action)
         self._consent_map[key] = ConsentState.DENY
 
-        self._history.append(
+        self._record(
             ConsentAction(
                 entity_from=entity_from,
                 entity_to=entity_to,
@@ -111,6 +114,14 @@ class ConsentManager:
             )
         )
 
+    def _record(self, consent_action: ConsentAction) -> None:
+        """Append an action to the history and index it under both entities."""
+        index = len(self._history)
+        self._history.append(consent_action)
+        self._by_entity[consent_action.entity_from].append(index)
+        if consent_action.entity_to != consent_action.entity_from:
+            self._by_entity[consent_action.entity_to].append(index)
+
     def check_consent(
         self,
         entity_from: str,
@@ -235,8 +246,4 @@ class ConsentManager:
         Returns:
             List of consent actions where entity is sender or receiver
         """
-        return [
-            action
-            for action in self._history
-            if action.entity_from == entity or action.entity_to == entity
-        ]
+        return [self._history[i] for i in self._by_entity.get(entity, ())]
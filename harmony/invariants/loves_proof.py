@@ -7,6 +7,7 @@ from __future__ import annotations
 from typing import Any
 
 import numpy as np
+import numpy.typing as npt
 
 from harmony.ops.acdc import ac_power, acdc_split
 
@@ -32,11 +33,12 @@ class LovesProofInvariant:
         c: np.ndarray,
         s: np.ndarray,
         x: np.ndarray,
+        dtype: npt.DTypeLike = np.float64,
     ) -> dict[str, Any]:
-        t = np.asarray(t, dtype=float)
-        c = np.asarray(c, dtype=float)
-        s = np.asarray(s, dtype=float)
-        x = np.asarray(x, dtype=float)
+        t = np.asarray(t, dtype=dtype)
+        c = np.asarray(c, dtype=dtype)
+        s = np.asarray(s, dtype=dtype)
+        x = np.asarray(x, dtype=dtype)
 
         n = min(len(t), len(c), len(s), len(x))
         if n < self.min_window:
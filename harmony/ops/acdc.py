@@ -5,24 +5,34 @@ AC/DC signal decomposition operator.
 from __future__ import annotations
 
 import numpy as np
+from scipy import signal
+
+
+def _as_float(x: np.ndarray) -> np.ndarray:
+    # Keep float32 input in single precision; everything else is computed in float64.
+    x = np.asarray(x)
+    return x if x.dtype == np.float32 else x.astype(float, copy=False)
 
 
 def ema_lpf(x: np.ndarray, alpha: float = 0.02) -> np.ndarray:
-    x = np.asarray(x, dtype=float)
+    x = _as_float(x)
     if x.size == 0:
         return x.copy()  # type: ignore[no-any-return]
 
-    y = np.empty_like(x, dtype=float)
-    y[0] = x[0]
-
-    for i in range(1, len(x)):
-        y[i] = alpha * x[i] + (1.0 - alpha) * y[i - 1]
-
+    # y[i] = alpha * x[i] + (1 - alpha) * y[i - 1], run as a first-order IIR filter in C
+    # along the last axis, so a stack of signals is filtered in one call.
+    # Seeding the filter state with (1 - alpha) * x[0] gives y[0] = x[0] up to rounding;
+    # it is then pinned exactly.
+    decay = 1.0 - alpha
+    b = np.array([alpha], dtype=x.dtype)
+    a = np.array([1.0, -decay], dtype=x.dtype)
+    y, _ = signal.lfilter(b, a, x, axis=-1, zi=decay * x[..., :1])
+    y[..., 0] = x[..., 0]
     return y  # type: ignore[no-any-return]
 
 
 def acdc_split(x: np.ndarray, alpha: float = 0.02) -> tuple[np.ndarray, np.ndarray]:
-    x = np.asarray(x, dtype=float)
+    x = _as_float(x)
     x_dc = ema_lpf(x, alpha=alpha)
     x_ac = x - x_dc
     return x_dc, x_ac
@@ -53,19 +63,20 @@ def ac_power_trend(x_ac: np.ndarray, t: np.ndarray) -> float:
     if len(x_ac) < 4:
         return 0.0
 
+    x_ac = np.asarray(x_ac, dtype=float)
+    t = np.asarray(t, dtype=float)
+
     window_size = max(4, len(x_ac) // 10)
     step = max(1, window_size // 2)
-    power_values = []
-    power_times = []
-
-    for i in range(0, len(x_ac) - window_size + 1, step):
-        window_ac = x_ac[i : i + window_size]
-        window_t = t[i : i + window_size]
-        if len(window_ac) >= 2:
-            power_values.append(ac_power(window_ac))
-            power_times.append(float(np.mean(window_t)))
-
-    if len(power_values) < 2:
+    starts = np.arange(0, len(x_ac) - window_size + 1, step)
+    if len(starts) < 2:
         return 0.0
 
-    return dc_slope(np.array(power_values), np.array(power_times))
+    # Windowed means of x_ac**2 and t from prefix sums, one pass over the signal.
+    power_cumsum = np.concatenate(([0.0], np.cumsum(x_ac**2)))
+    time_cumsum = np.concatenate(([0.0], np.cumsum(t[: len(x_ac)])))
+    ends = starts + window_size
+    power_values = (power_cumsum[ends] - power_cumsum[starts]) / window_size
+    power_times = (time_cumsum[ends] - time_cumsum[starts]) / window_size
+
+    return dc_slope(power_values, power_times)
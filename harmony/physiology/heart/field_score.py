@@ -3,8 +3,12 @@ from __future__ import annotations
 import numpy as np
 from scipy import stats
 
+from harmony.physiology.shared.streaming import StreamingStats
+
 from .stress import StressIndexBuilder
 
+PLV_CONTRIBUTION_DTYPE = np.dtype([("plv", "f8"), ("weight", "f8"), ("contribution", "f8")])
+
 
 class HeartFieldScorer:
     """Compute heart field scores and non-coercion checks."""
@@ -51,25 +55,28 @@ class HeartFieldScorer:
             weights = self.default_weights
 
         a_eff = heart_amplitude * heart_coherence
-        plv_product = 1.0
-        plv_contributions: dict[str, dict[str, float]] = {}
-
-        for channel, plv in plv_dict.items():
-            w = weights.get(channel, weights.get("other", 0.1))
-            plv_safe = max(plv, 1e-6)
-            channel_contribution = plv_safe**w
-            plv_product *= channel_contribution
-            plv_contributions[channel] = {
-                "plv": float(plv),
-                "weight": float(w),
-                "contribution": float(channel_contribution),
-            }
+        channels = list(plv_dict)
+        fallback = weights.get("other", 0.1)
+        plvs = np.fromiter(plv_dict.values(), dtype=float, count=len(channels))
+        ws = np.fromiter(
+            (weights.get(c, fallback) for c in channels), dtype=float, count=len(channels)
+        )
+        contributions = np.maximum(plvs, 1e-6) ** ws
+        plv_product = float(contributions.prod())
+        records = np.empty(len(channels), dtype=PLV_CONTRIBUTION_DTYPE)
+        records["plv"] = plvs
+        records["weight"] = ws
+        records["contribution"] = contributions
+        plv_contributions = {
+            channel: {"plv": plv, "weight": w, "contribution": contribution}
+            for channel, plv, w, contribution in zip(
+                channels, plvs.tolist(), ws.tolist(), contributions.tolist()
+            )
+        }
 
         a_net = a_eff * plv_product
 
-        distance_scaling = 1.0
-        if distance is not None and distance > 0:
-            distance_scaling = (self.r0 / distance) ** self.falloff_exp
+        distance_scaling = self._distance_scaling(distance)
         a_net_scaled = a_net * distance_scaling
 
         return {
@@ -77,6 +84,7 @@ class HeartFieldScorer:
             "heart_coherence": float(heart_coherence),
             "effective_field": float(a_eff),
             "plv_contributions": plv_contributions,
+            "plv_records": records,
             "plv_product": float(plv_product),
             "net_field": float(a_net),
             "distance_scaling": float(distance_scaling),
@@ -84,6 +92,30 @@ class HeartFieldScorer:
             "weights_used": weights,
         }
 
+    def compute_net_field_vec(
+        self,
+        heart_amplitude: float,
+        heart_coherence: float,
+        plv_arr: np.ndarray,
+        w_arr: np.ndarray,
+        distance: float | None = None,
+    ) -> float:
+        """Distance-scaled net field from fixed-order PLV and weight arrays.
+
+        Array counterpart of ``compute_net_field`` for hot loops: returns only
+        ``net_field_scaled`` and forms the weighted PLV product as a single
+        ``exp(w . log(plv))`` dot product, with the same 1e-6 PLV floor.
+        """
+        log_plv = np.log(np.maximum(plv_arr, 1e-6))
+        plv_product = np.exp(np.dot(w_arr, log_plv))
+        net_field = heart_amplitude * heart_coherence * plv_product
+        return float(net_field * self._distance_scaling(distance))
+
+    def _distance_scaling(self, distance: float | None) -> float:
+        if distance is not None and distance > 0:
+            return float((self.r0 / distance) ** self.falloff_exp)
+        return 1.0
+
     def compute_non_coercion_check(
         self,
         coherence_values: np.ndarray,
@@ -93,7 +125,8 @@ class HeartFieldScorer:
         window_sec: float = 60.0,
     ) -> dict[str, object]:
         epsilon = 1e-6
-        log_coherence = np.log(coherence_values + epsilon)
+        log_coherence = np.add(coherence_values, epsilon, dtype=float)
+        np.log(log_coherence, out=log_coherence)
 
         if len(time_points) <= 1:
             return {
@@ -106,7 +139,7 @@ class HeartFieldScorer:
                 "message": "Insufficient data for constraint check",
             }
 
-        gain_rate = np.gradient(log_coherence, time_points)
+        gain_rate = np.gradient(log_coherence, time_points, edge_order=1)
 
         stress_decreasing = None
         stress_slope = None
@@ -126,19 +159,14 @@ class HeartFieldScorer:
         if stress_proxy is not None and not isinstance(stress_proxy, np.ndarray):
             stress_proxy = np.array(stress_proxy)
 
-        if stress_proxy is not None and len(stress_proxy) >= 2:
-            min_len = min(len(gain_rate), len(stress_proxy))
-            if min_len >= 2:
-                time_aligned = time_points[:min_len]
-                stress_aligned = stress_proxy[:min_len]
-                gain_aligned = gain_rate[:min_len]
-                stress_slope, _, _, _, _ = stats.linregress(time_aligned, stress_aligned)
+        gain_aligned = gain_rate
+        if stress_proxy is not None:
+            m = min(len(gain_rate), len(stress_proxy))
+            if m >= 2:
+                gain_aligned = gain_rate[:m]
+                stress_slope, _, _, _, _ = stats.linregress(time_points[:m], stress_proxy[:m])
                 stress_decreasing = stress_slope < 0
-                recent_g = float(np.mean(gain_aligned[-min(10, len(gain_aligned)) :]))
-            else:
-                recent_g = float(np.mean(gain_rate[-min(10, len(gain_rate)) :]))
-        else:
-            recent_g = float(np.mean(gain_rate[-min(10, len(gain_rate)) :]))
+        recent_g = float(np.mean(gain_aligned[-10:]))
 
         if stress_decreasing is not None:
             constraint_satisfied = (recent_g > 0) and bool(stress_decreasing)
@@ -162,15 +190,23 @@ class HeartFieldScorer:
         stress_proxy: np.ndarray,
         heart_amplitude: np.ndarray,
         plv_dict: dict[str, float],
+        amplitude_stats: StreamingStats | None = None,
+        coherence_stats: StreamingStats | None = None,
         **kwargs: object,
     ) -> dict[str, object]:
+        if amplitude_stats is not None:
+            amplitude = amplitude_stats.std()
+        else:
+            amplitude = float(np.std(heart_amplitude))
+
+        if coherence_stats is not None:
+            coherence = coherence_stats.tail_mean()
+        else:
+            coherence = float(np.mean(heart_coherence[-100:]))
+
         field_result = self.compute_net_field(
-            heart_amplitude=float(np.std(heart_amplitude)),
-            heart_coherence=float(
-                np.mean(heart_coherence[-100:])
-                if len(heart_coherence) > 100
-                else np.mean(heart_coherence)
-            ),
+            heart_amplitude=amplitude,
+            heart_coherence=coherence,
             plv_dict=plv_dict,
             **kwargs,  # type: ignore[arg-type]
         )
@@ -2,6 +2,15 @@ import numpy as np
 from scipy import signal
 
 
+def _select_percentile(x: np.ndarray, q: float) -> float:
+    """Linear-interpolated percentile via a two-point O(n) partial selection."""
+    pos = (len(x) - 1) * q / 100.0
+    lo = int(pos)
+    hi = min(lo + 1, len(x) - 1)
+    part = np.partition(x, (lo, hi))
+    return float(part[lo] + (pos - lo) * (part[hi] - part[lo]))
+
+
 class SignalPreprocessor:
     """Clean and prepare physiological signals."""
 
@@ -16,6 +25,7 @@ class SignalPreprocessor:
         self.notch_freq = notch_freq
         self.heart_band = heart_band
         self.resp_band = resp_band
+        self._r_peak_distance = int(0.5 * fs)
 
     def apply_notch_filter(self, x: np.ndarray, q: float = 30.0) -> np.ndarray:
         b, a = signal.iirnotch(self.notch_freq, q, self.fs)  # type: ignore[misc]
@@ -39,17 +49,14 @@ class SignalPreprocessor:
         return signal.filtfilt(b, a, x)  # type: ignore[no-any-return]
 
     def preprocess_heart_signal(self, x: np.ndarray, remove_drift: bool = True) -> np.ndarray:
-        x_clean = x.copy()
-        x_clean = self.apply_notch_filter(x_clean)
+        x_clean = self.apply_notch_filter(x)
         if remove_drift:
             x_clean = self.remove_baseline_drift(x_clean)
         x_clean = self.apply_bandpass(x_clean, self.heart_band)
         return x_clean
 
     def preprocess_resp_signal(self, x: np.ndarray) -> np.ndarray:
-        x_clean = x.copy()
-        x_clean = self.apply_bandpass(x_clean, self.resp_band)
-        return x_clean
+        return self.apply_bandpass(x, self.resp_band)
 
     def robust_amplitude(
         self, x: np.ndarray, method: str = "p2p", window_sec: float = 30.0
@@ -81,7 +88,7 @@ class SignalPreprocessor:
     def detect_r_peaks(self, ecg_signal: np.ndarray) -> np.ndarray:
         peaks, _ = signal.find_peaks(  # type: ignore[misc]
             ecg_signal,
-            distance=int(0.5 * self.fs),
-            height=np.percentile(ecg_signal, 75),
+            distance=self._r_peak_distance,
+            height=_select_percentile(ecg_signal, 75.0),
         )
         return peaks  # type: ignore[no-any-return]
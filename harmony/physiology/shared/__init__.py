@@ -1,7 +1,10 @@
 """Shared mathematical tools for physiology modules."""
 
-from . import phase_tools
+from . import phase_tools, streaming
+from .streaming import StreamingStats
 
 __all__ = [
     "phase_tools",
+    "streaming",
+    "StreamingStats",
 ]
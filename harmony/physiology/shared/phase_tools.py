@@ -5,13 +5,35 @@ These are mathematical primitives, not physiological models.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import numpy as np
-from scipy import signal, stats
+from scipy import fft as sp_fft
+
+
+@lru_cache(maxsize=32)
+def _analytic_mask(n: int) -> np.ndarray:
+    """One-sided spectrum weights: 1 at DC (and Nyquist for even n), 2 elsewhere."""
+    mask = np.full(n // 2 + 1, 2.0)
+    mask[0] = 1.0
+    if n % 2 == 0:
+        mask[-1] = 1.0
+    mask.flags.writeable = False
+    return mask
+
+
+def analytic_signal_rfft(x: np.ndarray) -> np.ndarray:
+    """Analytic signal of a real 1-D array via a half-length real FFT (matches signal.hilbert)."""
+    n = len(x)
+    spectrum = np.zeros(n, dtype=complex)
+    half = sp_fft.rfft(x)
+    np.multiply(half, _analytic_mask(n), out=spectrum[: len(half)])
+    return sp_fft.ifft(spectrum, overwrite_x=True)  # type: ignore[no-any-return]
 
 
 def compute_analytic_signal(x: np.ndarray, fs: float) -> tuple[np.ndarray, np.ndarray]:
     """Compute analytic signal z(t) = x(t) + i*H[x(t)]."""
-    analytic = signal.hilbert(x)
+    analytic = analytic_signal_rfft(x)
     amplitude = np.abs(analytic)
     phase = np.angle(analytic)
     return amplitude, phase
@@ -24,43 +46,68 @@ def remove_linear_phase_trend(phase: np.ndarray, t: np.ndarray | None = None) ->
     if len(phase) == 1:
         return np.array([0.0])
 
+    phase = np.asarray(phase, dtype=float)
     if t is None:
         t = np.arange(len(phase))
+    else:
+        t = np.asarray(t, dtype=float)
+
+    # Closed-form least squares on centered time; linregress' p-value/stderr are unused
+    t_centered = t - t.mean()
+    slope = (t_centered @ phase) / (t_centered @ t_centered)
+    return phase - phase.mean() - slope * t_centered  # type: ignore[no-any-return]
+
+
+def compute_instantaneous_frequency(phase: np.ndarray, fs: float) -> np.ndarray:
+    """Compute f = d(phi)/dt / (2*pi) with central differences into one buffer."""
+    if len(phase) < 2:
+        return np.gradient(phase) * fs / (2.0 * np.pi)  # type: ignore[no-any-return]
+
+    scale = fs / (2.0 * np.pi)
+    freq = np.empty(len(phase))
+    np.subtract(phase[2:], phase[:-2], out=freq[1:-1])
+    freq[1:-1] *= 0.5 * scale
+    freq[0] = (phase[1] - phase[0]) * scale
+    freq[-1] = (phase[-1] - phase[-2]) * scale
+    return freq
+
 
-    slope, intercept, _, _, _ = stats.linregress(t, phase)  # type: ignore[misc]
-    trend = intercept + slope * t
-    return phase - trend  # type: ignore[no-any-return]
+def _mean_resultant_length(phase: np.ndarray) -> float:
+    """Compute |<exp(i*phi)>| from real cos/sin sums, without a complex buffer."""
+    return float(np.hypot(np.cos(phase).sum(), np.sin(phase).sum()) / len(phase))
 
 
 def compute_phase_concentration(phase: np.ndarray) -> float:
     """Compute phase concentration C = |<exp(i*phi)>|."""
     if len(phase) == 0:
         return float("nan")
-    complex_mean = np.mean(np.exp(1j * phase))
-    return float(np.abs(complex_mean))
+    return _mean_resultant_length(phase)
 
 
 def compute_phase_lock_value(phase1: np.ndarray, phase2: np.ndarray) -> float:
     """Compute phase-locking value between two phase sequences."""
     if len(phase1) == 0 or len(phase2) == 0:
         return float("nan")
-    phase_diff = phase1 - phase2
-    complex_avg = np.mean(np.exp(1j * phase_diff))
-    return float(np.abs(complex_avg))
+    return _mean_resultant_length(phase1 - phase2)
 
 
-def bias_corrected_plv(phase1: np.ndarray, phase2: np.ndarray, n_shuffles: int = 100) -> float:
+def bias_corrected_plv(
+    phase1: np.ndarray,
+    phase2: np.ndarray,
+    n_shuffles: int = 100,
+    random_state: int | np.random.Generator | None = None,
+) -> float:
     """Bias-correct PLV using circular shuffling."""
     raw_plv = compute_phase_lock_value(phase1, phase2)
 
     if n_shuffles <= 0 or len(phase1) < 100:
         return raw_plv
 
+    rng = np.random.default_rng(random_state)
     shuffled_plvs = []
     n_samples = len(phase2)
 
-    for _ in range(n_shuffles):
-        shift = np.random.randint(n_samples)
+    for shift in rng.integers(n_samples, size=n_shuffles):
         phase2_shuffled = np.roll(phase2, shift)
         shuffled_plvs.append(compute_phase_lock_value(phase1, phase2_shuffled))
 
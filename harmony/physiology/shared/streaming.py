@@ -0,0 +1,56 @@
+"""
+Streaming summary statistics for incrementally arriving samples.
+These are mathematical primitives, not physiological models.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+
+import numpy as np
+
+
+class StreamingStats:
+    """Running mean/std (batched Welford) plus a bounded tail for recent means."""
+
+    def __init__(self, tail_size: int = 100) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._tail: deque[float] = deque(maxlen=tail_size)
+
+    def push(self, batch: np.ndarray | float) -> None:
+        """Merge a batch of new samples into the running statistics."""
+        values = np.atleast_1d(np.asarray(batch, dtype=float))
+        n_b = len(values)
+        if n_b == 0:
+            return
+
+        mean_b = float(values.mean())
+        centered = values - mean_b
+        m2_b = float(centered @ centered)
+
+        n_a = self.count
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self._m2 += m2_b + delta * delta * n_a * n_b / n
+        self.count = n
+
+        self._tail.extend(values[-self._tail.maxlen :].tolist())  # type: ignore[misc]
+
+    def var(self) -> float:
+        """Population variance of all pushed samples."""
+        if self.count == 0:
+            return float("nan")
+        return self._m2 / self.count
+
+    def std(self) -> float:
+        """Population standard deviation of all pushed samples (matches np.std)."""
+        return float(np.sqrt(self.var()))
+
+    def tail_mean(self) -> float:
+        """Mean of the most recent ``tail_size`` samples."""
+        if not self._tail:
+            return float("nan")
+        return float(np.fromiter(self._tail, dtype=float, count=len(self._tail)).mean())
@@ -4,23 +4,44 @@ Drift detection for HarmonyØ4.
 Detects unintended behavioral changes without forcing correction.
 """
 
+import math
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 
 import numpy as np
 import numpy.typing as npt
 
+_INITIAL_EVENT_CAPACITY = 16
+
+
+def _l2_norm(v: npt.NDArray[np.float64]) -> float:
+    """Euclidean norm via a dot product, skipping np.linalg.norm's ord/axis dispatch."""
+    return float(np.sqrt(v @ v))
+
+
+def _datetime_to_ns(dt: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the epoch without float rounding."""
+    return int(dt.replace(microsecond=0).timestamp()) * 1_000_000_000 + dt.microsecond * 1_000
+
 
 @dataclass
 class DriftEvent:
     """Record of detected drift."""
 
-    timestamp: datetime
+    timestamp_ns: int  # Nanoseconds since the epoch (time.time_ns())
     drift_type: str  # "phase", "role", "boundary"
     magnitude: float
     threshold: float
     source: str  # Identifier of drifting entity
 
+    @property
+    def timestamp(self) -> datetime:
+        """Event time as a local datetime (microsecond resolution)."""
+        seconds, nanos = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1_000)
+
 
 class DriftDetector:
     """
@@ -43,40 +64,87 @@ class DriftDetector:
         """
         self.threshold = threshold
         self.window_size = window_size
-        self._events: list[DriftEvent] = []
+
+        # Events are stored column-wise (struct of arrays) and only turned back into
+        # DriftEvent objects for the rows a query selects.
+        self._n_events = 0
+        self._ts = np.empty(_INITIAL_EVENT_CAPACITY, dtype=np.int64)
+        self._type = np.empty(_INITIAL_EVENT_CAPACITY, dtype=np.int8)
+        self._mag = np.empty(_INITIAL_EVENT_CAPACITY, dtype=np.float64)
+        self._thr = np.empty(_INITIAL_EVENT_CAPACITY, dtype=np.float64)
+        self._src: list[str] = []
+        self._type_names: list[str] = []
+        self._type_codes: dict[str, int] = {}
 
     def record_event(self, event: DriftEvent) -> None:
         """Record a drift event."""
-        self._events.append(event)
+        i = self._n_events
+        if i == len(self._ts):
+            self._grow_events()
+
+        code = self._type_codes.get(event.drift_type)
+        if code is None:
+            code = self._type_codes[event.drift_type] = len(self._type_names)
+            self._type_names.append(event.drift_type)
+
+        self._ts[i] = event.timestamp_ns
+        self._type[i] = code
+        self._mag[i] = event.magnitude
+        self._thr[i] = event.threshold
+        self._src.append(event.source)
+        self._n_events = i + 1
+
+    def _grow_events(self) -> None:
+        """Double the capacity of the event columns."""
+        for name in ("_ts", "_type", "_mag", "_thr"):
+            column = getattr(self, name)
+            grown = np.empty(2 * len(column), dtype=column.dtype)
+            grown[: len(column)] = column
+            setattr(self, name, grown)
 
     def get_events(
         self,
         drift_type: str | None = None,
-        since: datetime | None = None,
+        since: datetime | int | None = None,
     ) -> list[DriftEvent]:
         """
         Get drift events with optional filtering.
 
         Args:
             drift_type: Filter by drift type
-            since: Filter by events after this time
+            since: Filter by events after this time (datetime or epoch nanoseconds)
 
         Returns:
             List of matching drift events
         """
-        events = self._events
+        n = self._n_events
+        mask = np.ones(n, dtype=bool)
 
         if drift_type is not None:
-            events = [e for e in events if e.drift_type == drift_type]
+            code = self._type_codes.get(drift_type)
+            if code is None:
+                return []
+            mask &= self._type[:n] == code
 
         if since is not None:
-            events = [e for e in events if e.timestamp >= since]
-
-        return events
+            since_ns = _datetime_to_ns(since) if isinstance(since, datetime) else since
+            mask &= self._ts[:n] >= since_ns
+
+        return [
+            DriftEvent(
+                timestamp_ns=int(self._ts[i]),
+                drift_type=self._type_names[self._type[i]],
+                magnitude=float(self._mag[i]),
+                threshold=float(self._thr[i]),
+                source=self._src[i],
+            )
+            for i in np.flatnonzero(mask)
+        ]
 
     def clear_events(self) -> None:
         """Clear event history."""
-        self._events.clear()
+        self._n_events = 0
+        self._src.clear()
 
 
 class PhaseDriftDetector(DriftDetector):
@@ -86,17 +154,38 @@ class PhaseDriftDetector(DriftDetector):
         self,
         threshold: float = 0.1,
         window_size: int = 10,
+        method: str = "baseline",
+        delta: float = 0.002,
     ) -> None:
         """
         Initialize phase drift detector.
 
         Args:
-            threshold: Maximum allowed coherence drift
+            threshold: Maximum allowed coherence drift ("baseline" method)
             window_size: Window for baseline comparison
+            method: "baseline" (absolute difference from a fixed baseline) or
+                "adwin" (two-window mean test with an adaptive Hoeffding bound)
+            delta: Confidence parameter of the "adwin" test
         """
+        if method not in ("baseline", "adwin"):
+            raise ValueError(f"Unknown drift method: {method}")
+
         super().__init__(threshold, window_size)
+        self.method = method
+        self.delta = delta
         self.baseline_coherence: float | None = None
-        self._coherence_history: list[float] = []
+        self._coherence_history: deque[float] = deque(maxlen=window_size)
+        # Trend abscissa 0..window_size-1, sliced per query instead of rebuilt
+        self._x = np.arange(window_size, dtype=np.float64)
+
+        # ADWIN-style windows: samples leaving the recent window move into the reference
+        # window. Running sums keep each test O(1) instead of rescanning the history.
+        self._recent: deque[float] = deque()
+        self._recent_size = max(window_size // 2, 1)
+        self._reference: deque[float] = deque()
+        self._reference_size = max(window_size - self._recent_size, 1)
+        self._recent_s1 = self._recent_s2 = 0.0
+        self._reference_s1 = self._reference_s2 = 0.0
 
     def set_baseline(self, coherence: float) -> None:
         """
@@ -124,6 +213,9 @@ class PhaseDriftDetector(DriftDetector):
         """
         self._coherence_history.append(current_coherence)
 
+        if self.method == "adwin":
+            return self._check_windowed_drift(current_coherence, source)
+
         if self.baseline_coherence is None:
             self.baseline_coherence = current_coherence
             return False, 0.0
@@ -132,7 +224,7 @@ class PhaseDriftDetector(DriftDetector):
 
         if drift > self.threshold:
             event = DriftEvent(
-                timestamp=datetime.now(),
+                timestamp_ns=time.time_ns(),
                 drift_type="phase",
                 magnitude=drift,
                 threshold=self.threshold,
@@ -143,6 +235,65 @@ class PhaseDriftDetector(DriftDetector):
 
         return False, drift
 
+    def _check_windowed_drift(
+        self,
+        current_coherence: float,
+        source: str,
+    ) -> tuple[bool, float]:
+        """
+        ADWIN-style test between the reference and recent windows.
+
+        Drift fires when the window means differ by more than
+        eps_cut = sqrt((2/m) * var * ln(2/delta')) + (2 / (3m)) * ln(2/delta'),
+        where m is the harmonic mean of the window sizes and delta' = delta / n.
+        """
+        x = current_coherence
+        self._recent.append(x)
+        self._recent_s1 += x
+        self._recent_s2 += x * x
+
+        if len(self._recent) > self._recent_size:
+            moved = self._recent.popleft()
+            self._recent_s1 -= moved
+            self._recent_s2 -= moved * moved
+            self._reference.append(moved)
+            self._reference_s1 += moved
+            self._reference_s2 += moved * moved
+            if len(self._reference) > self._reference_size:
+                old = self._reference.popleft()
+                self._reference_s1 -= old
+                self._reference_s2 -= old * old
+
+        n0 = len(self._reference)
+        n1 = len(self._recent)
+        if n0 == 0:
+            return False, 0.0
+
+        n = n0 + n1
+        mean = (self._reference_s1 + self._recent_s1) / n
+        variance = max((self._reference_s2 + self._recent_s2) / n - mean * mean, 0.0)
+        m = 1.0 / (1.0 / n0 + 1.0 / n1)
+        log_term = math.log(2.0 * n / self.delta)
+        eps_cut = math.sqrt(2.0 / m * variance * log_term) + 2.0 / (3.0 * m) * log_term
+
+        drift = abs(self._reference_s1 / n0 - self._recent_s1 / n1)
+
+        if drift > eps_cut:
+            event = DriftEvent(
+                timestamp_ns=time.time_ns(),
+                drift_type="phase",
+                magnitude=drift,
+                threshold=eps_cut,
+                source=source,
+            )
+            # As in ADWIN, drop the stale reference window once a change is detected
+            self._reference.clear()
+            self._reference_s1 = self._reference_s2 = 0.0
+            self.record_event(event)
+            return True, drift
+
+        return False, drift
+
     def get_coherence_trend(self) -> str:
         """
         Analyze coherence trend.
@@ -153,11 +304,12 @@ class PhaseDriftDetector(DriftDetector):
         if len(self._coherence_history) < 2:
             return "insufficient_data"
 
-        recent = self._coherence_history[-self.window_size :]
-        x = np.arange(len(recent))
-        y = np.array(recent)
+        n = len(self._coherence_history)
+        y = np.fromiter(self._coherence_history, dtype=np.float64, count=n)
 
-        slope = np.polyfit(x, y, 1)[0]
+        # Closed-form least-squares slope on x = 0..n-1 (no Vandermonde/lstsq):
+        # sum((x - x_mean) * y) == x @ y - x_mean * sum(y)
+        slope = (float(self._x[:n] @ y) - (n - 1) / 2.0 * float(y.sum())) / (n * (n * n - 1) / 12.0)
 
         if abs(slope) < 0.01:
             return "stable"
@@ -183,7 +335,7 @@ class BoundaryDriftDetector(DriftDetector):
             window_size: Window for trend analysis
         """
         super().__init__(threshold, window_size)
-        self._boundary_history: list[float] = []
+        self._boundary_history: deque[float] = deque(maxlen=max(window_size, 2))
 
     def check_drift(
         self,
@@ -214,7 +366,7 @@ class BoundaryDriftDetector(DriftDetector):
 
         if drift > self.threshold:
             event = DriftEvent(
-                timestamp=datetime.now(),
+                timestamp_ns=time.time_ns(),
                 drift_type="boundary",
                 magnitude=drift,
                 threshold=self.threshold,
@@ -243,7 +395,12 @@ class RoleDriftDetector(DriftDetector):
         """
         super().__init__(threshold, window_size)
         self.baseline_state: npt.NDArray[np.float64] | None = None
-        self._state_history: list[npt.NDArray[np.float64]] = []
+        # Scratch buffer for current_state - baseline_state, reused across checks
+        self._diff: npt.NDArray[np.float64] | None = None
+        # Circular (window_size, dim) buffer, allocated on the first sample
+        self._state_history: npt.NDArray[np.float64] | None = None
+        self._history_cursor = 0
+        self._history_filled = 0
 
     def set_baseline(self, state: npt.NDArray[np.float64]) -> None:
         """
@@ -253,6 +410,7 @@ class RoleDriftDetector(DriftDetector):
             state: Baseline state vector
         """
         self.baseline_state = state.copy()
+        self._diff = np.empty(self.baseline_state.shape)
 
     def check_drift(
         self,
@@ -269,17 +427,20 @@ class RoleDriftDetector(DriftDetector):
         Returns:
             Tuple of (drift_detected, drift_magnitude)
         """
-        self._state_history.append(current_state.copy())
+        self._push_state(current_state)
 
         if self.baseline_state is None:
-            self.baseline_state = current_state.copy()
+            self.set_baseline(current_state)
             return False, 0.0
 
-        drift = float(np.linalg.norm(current_state - self.baseline_state))
+        if self._diff is None or self._diff.shape != self.baseline_state.shape:
+            self._diff = np.empty(self.baseline_state.shape)
+        np.subtract(current_state, self.baseline_state, out=self._diff)
+        drift = _l2_norm(self._diff)
 
         if drift > self.threshold:
             event = DriftEvent(
-                timestamp=datetime.now(),
+                timestamp_ns=time.time_ns(),
                 drift_type="role",
                 magnitude=drift,
                 threshold=self.threshold,
@@ -289,3 +450,27 @@ class RoleDriftDetector(DriftDetector):
             return True, drift
 
         return False, drift
+
+    def _push_state(self, state: npt.NDArray[np.float64]) -> None:
+        """Write a state into the circular history buffer without allocating."""
+        if self._state_history is None or self._state_history.shape[1] != state.shape[0]:
+            self._state_history = np.empty((max(self.window_size, 1), state.shape[0]))
+            self._history_cursor = 0
+            self._history_filled = 0
+
+        self._state_history[self._history_cursor] = state
+        self._history_cursor = (self._history_cursor + 1) % len(self._state_history)
+        self._history_filled = min(self._history_filled + 1, len(self._state_history))
+
+    def get_state_history(self) -> npt.NDArray[np.float64]:
+        """
+        Get the most recent role states, oldest first.
+
+        Returns:
+            Array of shape (n_states, dim), at most window_size rows
+        """
+        if self._state_history is None:
+            return np.empty((0, 0))
+        if self._history_filled < len(self._state_history):
+            return self._state_history[: self._history_filled].copy()
+        return np.roll(self._state_history, -self._history_cursor, axis=0)
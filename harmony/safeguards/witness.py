@@ -24,6 +24,7 @@ class WitnessProjection:
         source_dim: int,
         target_dim: int,
         seed: int | None = None,
+        dtype: npt.DTypeLike = np.float64,
     ) -> None:
         """
         Initialize witness projection.
@@ -32,6 +33,7 @@ class WitnessProjection:
             source_dim: Dimensionality of source observer state
             target_dim: Dimensionality of projection (target_dim <= source_dim)
             seed: Random seed for deterministic projections
+            dtype: Storage dtype of the projection matrix (float32 halves bandwidth)
         """
         if target_dim > source_dim:
             raise ValueError(f"Target dimension ({target_dim}) cannot exceed source ({source_dim})")
@@ -39,13 +41,14 @@ class WitnessProjection:
         self.source_dim = source_dim
         self.target_dim = target_dim
 
-        # Create deterministic projection matrix
+        # Create deterministic projection matrix with orthonormal rows (QR of a
+        # Gaussian sketch), so projection axes are uncorrelated and unit-length
         rng = np.random.default_rng(seed)
-        self.projection_matrix = rng.standard_normal((target_dim, source_dim))
+        q, _ = np.linalg.qr(rng.standard_normal((source_dim, target_dim)))
+        self.projection_matrix = np.ascontiguousarray(q.T, dtype=dtype)
 
-        # Normalize rows
-        norms = np.linalg.norm(self.projection_matrix, axis=1, keepdims=True)
-        self.projection_matrix /= norms
+        # The matrix is fixed after construction, so its rank (one SVD) is computed once
+        self._rank = int(np.linalg.matrix_rank(self.projection_matrix))
 
     def project(
         self,
@@ -70,7 +73,32 @@ class WitnessProjection:
                 f"State dimension ({state.shape[0]}) does not match source ({self.source_dim})"
             )
 
-        return self.projection_matrix @ state
+        return self.projection_matrix @ state.astype(self.projection_matrix.dtype, copy=False)
+
+    def project_batch(
+        self,
+        states: npt.NDArray[np.float64],
+        consent: bool,
+    ) -> npt.NDArray[np.float64] | None:
+        """
+        Project a batch of observer states with a single matrix product.
+
+        Args:
+            states: Source observer states, shape (batch, source_dim)
+            consent: Whether projection is consented to
+
+        Returns:
+            Projected states of shape (batch, target_dim) if consented, None otherwise
+        """
+        if not consent:
+            return None
+
+        if states.ndim != 2 or states.shape[1] != self.source_dim:
+            raise ValueError(
+                f"States shape {states.shape} does not match (batch, {self.source_dim})"
+            )
+
+        return states.astype(self.projection_matrix.dtype, copy=False) @ self.projection_matrix.T
 
     def is_invertible(self) -> bool:
         """
@@ -79,10 +107,7 @@ class WitnessProjection:
         Returns:
             False (projections are intentionally lossy)
         """
-        return (
-            self.target_dim == self.source_dim
-            and np.linalg.matrix_rank(self.projection_matrix) == self.source_dim
-        )
+        return self.target_dim == self.source_dim and self._rank == self.source_dim
 
     def information_loss(self) -> float:
         """
@@ -105,6 +130,11 @@ class WitnessRegistry:
         """Initialize witness registry."""
         self._projections: dict[tuple[str, str], WitnessProjection] = {}
         self._consent_map: dict[tuple[str, str], bool] = {}
+        # source_id -> consented target_ids (dict used as an insertion-ordered set)
+        self._by_source: dict[str, dict[str, None]] = {}
+        # Bumped on every registration/consent change to invalidate _stack_cache
+        self._version = 0
+        self._stack_cache: dict[str, tuple[int, list[str], npt.NDArray[np.float64], list[int]]] = {}
 
     def register_projection(
         self,
@@ -124,7 +154,7 @@ class WitnessRegistry:
         """
         key = (source_id, target_id)
         self._projections[key] = projection
-        self._consent_map[key] = consent
+        self._set_consent(source_id, target_id, consent)
 
     def grant_witness_consent(
         self,
@@ -145,7 +175,7 @@ class WitnessRegistry:
         if key not in self._projections:
             return False
 
-        self._consent_map[key] = True
+        self._set_consent(source_id, target_id, True)
         return True
 
     def revoke_witness_consent(
@@ -167,9 +197,19 @@ class WitnessRegistry:
         if key not in self._projections:
             return False
 
-        self._consent_map[key] = False
+        self._set_consent(source_id, target_id, False)
         return True
 
+    def _set_consent(self, source_id: str, target_id: str, consent: bool) -> None:
+        """Update consent and keep the per-source reverse index in sync."""
+        self._consent_map[(source_id, target_id)] = consent
+        self._version += 1
+        targets = self._by_source.setdefault(source_id, {})
+        if consent:
+            targets[target_id] = None
+        else:
+            targets.pop(target_id, None)
+
     def witness(
         self,
         source_id: str,
@@ -197,6 +237,51 @@ class WitnessRegistry:
 
         return projection.project(source_state, consent)
 
+    def witness_all(
+        self,
+        source_id: str,
+        source_state: npt.NDArray[np.float64],
+    ) -> dict[str, npt.NDArray[np.float64]]:
+        """
+        Project a source state for every consenting witness in one matrix product.
+
+        Args:
+            source_id: ID of source observer
+            source_state: State of source observer
+
+        Returns:
+            Mapping of target observer ID to its projected state
+        """
+        cached = self._stack_cache.get(source_id)
+        if cached is None or cached[0] != self._version:
+            targets = self.get_consented_witnesses(source_id)
+            if not targets:
+                return {}
+            projections = [self._projections[(source_id, tgt)] for tgt in targets]
+            for projection in projections:
+                if projection.source_dim != source_state.shape[0]:
+                    raise ValueError(
+                        f"State dimension ({source_state.shape[0]}) does not match source "
+                        f"({projection.source_dim})"
+                    )
+            matrices = [projection.projection_matrix for projection in projections]
+            stacked = np.vstack(matrices)
+            offsets = [0]
+            for matrix in matrices:
+                offsets.append(offsets[-1] + matrix.shape[0])
+            cached = (self._version, targets, stacked, offsets)
+            self._stack_cache[source_id] = cached
+
+        _, targets, stacked, offsets = cached
+        if stacked.shape[1] != source_state.shape[0]:
+            raise ValueError(
+                f"State dimension ({source_state.shape[0]}) does not match source "
+                f"({stacked.shape[1]})"
+            )
+
+        projected = stacked @ source_state.astype(stacked.dtype, copy=False)
+        return {tgt: projected[offsets[i] : offsets[i + 1]] for i, tgt in enumerate(targets)}
+
     def get_consented_witnesses(self, source_id: str) -> list[str]:
         """
         Get list of observers with witness consent from source.
@@ -207,8 +292,4 @@ class WitnessRegistry:
         Returns:
             List of target observer IDs with consent
         """
-        consented = []
-        for (src, tgt), consent in self._consent_map.items():
-            if src == source_id and consent:
-                consented.append(tgt)
-        return consented
+        return list(self._by_source.get(source_id, ()))
@@ -1,5 +1,25 @@
+from functools import lru_cache
+
 import numpy as np
-from scipy import signal, stats
+from scipy import fft
+
+
+@lru_cache(maxsize=32)
+def _analytic_mask(n: int) -> np.ndarray:
+    mask = np.full(n // 2 + 1, 2.0)
+    mask[0] = 1.0
+    if n % 2 == 0:
+        mask[-1] = 1.0
+    mask.flags.writeable = False
+    return mask
+
+
+def _analytic_via_rfft(x: np.ndarray) -> np.ndarray:
+    n = len(x)
+    spectrum = np.zeros(n, dtype=complex)
+    half = fft.rfft(x)
+    np.multiply(half, _analytic_mask(n), out=spectrum[: len(half)])
+    return fft.ifft(spectrum, overwrite_x=True)
 
 
 class AnalyticSignal:
@@ -9,7 +29,7 @@ class AnalyticSignal:
         self.fs = fs
 
     def compute(self, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
-        analytic = signal.hilbert(x)
+        analytic = _analytic_via_rfft(x)
         amplitude_envelope = np.abs(analytic)
         instantaneous_phase = np.angle(analytic)
         return amplitude_envelope, instantaneous_phase
@@ -23,12 +43,25 @@ class AnalyticSignal:
         if len(phase) == 1:
             return np.array([0.0])
 
+        phase = np.asarray(phase, dtype=float)
         if t is None:
             t = np.arange(len(phase)) / self.fs
+        else:
+            t = np.asarray(t, dtype=float)
 
-        slope, intercept, _, _, _ = stats.linregress(t, phase)
-        trend = intercept + slope * t
-        return phase - trend
+        # Closed-form least squares on centered time; linregress' p-value/stderr are unused
+        t_centered = t - t.mean()
+        slope = (t_centered @ phase) / (t_centered @ t_centered)
+        return phase - phase.mean() - slope * t_centered
 
     def instantaneous_frequency(self, phase: np.ndarray) -> np.ndarray:
-        return np.gradient(phase) * self.fs / (2.0 * np.pi)
+        if len(phase) < 2:
+            return np.gradient(phase) * self.fs / (2.0 * np.pi)
+
+        scale = self.fs / (2.0 * np.pi)
+        freq = np.empty(len(phase))
+        np.subtract(phase[2:], phase[:-2], out=freq[1:-1])
+        freq[1:-1] *= 0.5 * scale
+        freq[0] = (phase[1] - phase[0]) * scale
+        freq[-1] = (phase[-1] - phase[-2]) * scale
+        return freq
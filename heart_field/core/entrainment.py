@@ -26,28 +26,30 @@ class EntrainmentMetrics:
             return float("nan")
 
         use_correction = corrected if corrected is not None else self.bias_correction
-        phase_diff = phase1 - phase2
-        complex_avg = np.mean(np.exp(1j * phase_diff))
+        # exp(1j * (phase1 - phase2)) == phasor1 * conj_phasor2, so the exponentials are
+        # computed once and reused by every circular shift in the bias correction.
+        phasor1 = np.exp(1j * np.asarray(phase1))
+        conj_phasor2 = np.exp(-1j * np.asarray(phase2))
+        complex_avg = np.mean(phasor1 * conj_phasor2)
         raw_plv = float(np.abs(complex_avg))
 
         if not use_correction or len(phase1) < 100:
             return raw_plv
 
-        corrected_plv = self._bias_correct_plv(phase1, phase2, raw_plv)
+        corrected_plv = self._bias_correct_plv(phasor1, conj_phasor2, raw_plv)
         return max(corrected_plv, 0.0)
 
-    def _bias_correct_plv(self, phase1: np.ndarray, phase2: np.ndarray, raw_plv: float) -> float:
+    def _bias_correct_plv(
+        self, phasor1: np.ndarray, conj_phasor2: np.ndarray, raw_plv: float
+    ) -> float:
         if self.n_shuffles <= 0:
             return raw_plv
 
-        n_samples = len(phase2)
+        n_samples = len(conj_phasor2)
         shuffled_plvs = []
 
-        for _ in range(self.n_shuffles):
-            shift = int(self._rng.integers(n_samples))
-            phase2_shuffled = np.roll(phase2, shift)
-            phase_diff_shuffled = phase1 - phase2_shuffled
-            complex_avg_shuffled = np.mean(np.exp(1j * phase_diff_shuffled))
+        for shift in self._rng.integers(n_samples, size=self.n_shuffles):
+            complex_avg_shuffled = np.mean(phasor1 * np.roll(conj_phasor2, shift))
             shuffled_plvs.append(float(np.abs(complex_avg_shuffled)))
 
         bias_estimate = float(np.mean(shuffled_plvs))
@@ -1,6 +1,8 @@
 import numpy as np
 from scipy import signal
 
+from ..utils.peak_detection import select_percentile
+
 
 class SignalPreprocessor:
     """Clean and prepare physiological signals."""
@@ -16,6 +18,7 @@ class SignalPreprocessor:
         self.notch_freq = notch_freq
         self.heart_band = heart_band
         self.resp_band = resp_band
+        self._r_peak_distance = int(0.5 * fs)
 
     def apply_notch_filter(self, x: np.ndarray, Q: float = 30.0) -> np.ndarray:
         b, a = signal.iirnotch(self.notch_freq, Q, self.fs)
@@ -39,17 +42,14 @@ class SignalPreprocessor:
         return signal.filtfilt(b, a, x)
 
     def preprocess_heart_signal(self, x: np.ndarray, remove_drift: bool = True) -> np.ndarray:
-        x_clean = x.copy()
-        x_clean = self.apply_notch_filter(x_clean)
+        x_clean = self.apply_notch_filter(x)
         if remove_drift:
             x_clean = self.remove_baseline_drift(x_clean)
         x_clean = self.apply_bandpass(x_clean, self.heart_band)
         return x_clean
 
     def preprocess_resp_signal(self, x: np.ndarray) -> np.ndarray:
-        x_clean = x.copy()
-        x_clean = self.apply_bandpass(x_clean, self.resp_band)
-        return x_clean
+        return self.apply_bandpass(x, self.resp_band)
 
     def robust_amplitude(
         self, x: np.ndarray, method: str = "p2p", window_sec: float = 30.0
@@ -81,7 +81,7 @@ class SignalPreprocessor:
     def detect_r_peaks(self, ecg_signal: np.ndarray) -> np.ndarray:
         peaks, _ = signal.find_peaks(
             ecg_signal,
-            distance=int(0.5 * self.fs),
-            height=np.percentile(ecg_signal, 75),
+            distance=self._r_peak_distance,
+            height=select_percentile(ecg_signal, 75.0),
         )
         return peaks
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy import signal, stats
 
 
@@ -11,6 +14,10 @@ class StressIndexBuilder:
         self.fs = fs
         self.method = method
         self.weights = self._get_weights(method)
+        self._welch_nperseg = 256
+        self._welch_window = signal.get_window("hann", self._welch_nperseg)
+        self._eda_cutoff = 0.05
+        self._eda_sos = signal.butter(2, self._eda_cutoff / (fs / 2.0), btype="high", output="sos")
 
     def _get_weights(self, method: str) -> dict[str, float]:
         if method == "minimal":
@@ -49,7 +56,9 @@ class StressIndexBuilder:
         slope, intercept, _, _, _ = stats.linregress(t, heart_rate)
         detrended = heart_rate - (intercept + slope * t)
 
-        freqs, psd = signal.welch(detrended, fs=self.fs, nperseg=min(256, len(detrended)))
+        nperseg = min(self._welch_nperseg, len(detrended))
+        window = self._welch_window if nperseg == self._welch_nperseg else "hann"
+        freqs, psd = signal.welch(detrended, fs=self.fs, window=window, nperseg=nperseg)
 
         mask_lf = (freqs >= f_low[0]) & (freqs <= f_low[1])
         mask_hf = (freqs >= f_high[0]) & (freqs <= f_high[1])
@@ -66,16 +75,18 @@ class StressIndexBuilder:
         if len(eda_signal) < 10:
             return 0.0
 
-        nyquist = self.fs / 2.0
-        b, a = signal.butter(2, cutoff / nyquist, btype="high")
-        eda_filtered = signal.filtfilt(b, a, eda_signal)
+        if cutoff == self._eda_cutoff:
+            sos = self._eda_sos
+        else:
+            sos = signal.butter(2, cutoff / (self.fs / 2.0), btype="high", output="sos")
+        eda_filtered = signal.sosfiltfilt(sos, eda_signal)
         return float(np.std(eda_filtered) / (np.std(eda_signal) + 1e-6))
 
     def compute_rmssd(self, rr_intervals: np.ndarray) -> float:
         if len(rr_intervals) < 2:
             return 0.0
         differences = np.diff(rr_intervals)
-        return float(np.sqrt(np.mean(differences**2)))
+        return float(np.sqrt(differences @ differences / differences.size))
 
     def compute_stress_index(
         self,
@@ -131,7 +142,11 @@ class StressIndexBuilder:
         return results
 
     def compute_stress_timeseries(
-        self, signals_dict: dict[str, np.ndarray], window_sec: float = 30.0, step_sec: float = 5.0
+        self,
+        signals_dict: dict[str, np.ndarray],
+        window_sec: float = 30.0,
+        step_sec: float = 5.0,
+        n_jobs: int = 1,
     ) -> tuple[np.ndarray, np.ndarray, dict[str, list[float]]]:
         window_samples = int(window_sec * self.fs)
         step_samples = int(step_sec * self.fs)
@@ -145,22 +160,31 @@ class StressIndexBuilder:
         if n_windows <= 0:
             return np.array([]), np.array([]), {}
 
-        time_points = np.zeros(n_windows)
+        time_points = np.arange(n_windows) * step_samples / self.fs
         stress_values = np.zeros(n_windows)
-        component_history = {name: [] for name in self.weights.keys()}
-
-        for i in range(n_windows):
-            start = i * step_samples
-            end = start + window_samples
+        component_history: dict[str, list[float]] = {name: [] for name in self.weights.keys()}
+
+        # Every present signal spans at least min_samples, so each window exists for all of
+        # them; slice zero-copy strided views once instead of re-slicing per window.
+        windowed_views = {
+            name: sliding_window_view(np.asarray(signal_data), window_samples)[::step_samples]
+            for name, signal_data in signals_dict.items()
+            if signal_data is not None
+        }
 
-            windowed_signals = {}
-            for name, signal_data in signals_dict.items():
-                if signal_data is not None and len(signal_data) >= end:
-                    windowed_signals[name] = signal_data[start:end]
+        def stress_for_window(i: int) -> dict[str, object]:
+            windowed_signals = {name: views[i] for name, views in windowed_views.items()}
+            return self.compute_stress_index(**windowed_signals)
 
-            result = self.compute_stress_index(**windowed_signals)
+        # Windows are independent; scipy's filtering and FFT kernels release the GIL,
+        # so a thread pool overlaps them without copying the signals to workers.
+        if n_jobs == 1:
+            window_results = [stress_for_window(i) for i in range(n_windows)]
+        else:
+            with ThreadPoolExecutor(max_workers=n_jobs if n_jobs > 0 else None) as executor:
+                window_results = list(executor.map(stress_for_window, range(n_windows)))
 
-            time_points[i] = start / self.fs
+        for i, result in enumerate(window_results):
             stress_values[i] = float(result["stress_index"])
 
             components = result["components"]
@@ -1,27 +1,49 @@
+from functools import lru_cache
+
 import numpy as np
 from scipy import signal
 
 
-def notch_filter(x: np.ndarray, fs: float, notch_freq: float = 50.0, Q: float = 30.0) -> np.ndarray:
-    b, a = signal.iirnotch(notch_freq, Q, fs)
-    return signal.filtfilt(b, a, x)
+@lru_cache(maxsize=64)
+def _design_notch(fs: float, notch_freq: float, q: float) -> np.ndarray:
+    b, a = signal.iirnotch(notch_freq, q, fs)
+    return signal.tf2sos(b, a)
+
+
+@lru_cache(maxsize=64)
+def _design_butter(order: int, wn: float | tuple[float, float], btype: str) -> np.ndarray:
+    return signal.butter(order, wn, btype=btype, output="sos")
+
+
+def _apply_sos(sos: np.ndarray, x: np.ndarray, zero_phase: bool) -> np.ndarray:
+    if zero_phase:
+        return signal.sosfiltfilt(sos, x)
+    return signal.sosfilt(sos, x)
+
+
+def notch_filter(
+    x: np.ndarray, fs: float, notch_freq: float = 50.0, Q: float = 30.0, zero_phase: bool = True
+) -> np.ndarray:
+    return _apply_sos(_design_notch(fs, notch_freq, Q), x, zero_phase)
 
 
 def bandpass_filter(
-    x: np.ndarray, fs: float, low: float, high: float, order: int = 4
+    x: np.ndarray, fs: float, low: float, high: float, order: int = 4, zero_phase: bool = True
 ) -> np.ndarray:
     nyquist = fs / 2.0
-    b, a = signal.butter(order, [low / nyquist, high / nyquist], btype="band")
-    return signal.filtfilt(b, a, x)
+    sos = _design_butter(order, (low / nyquist, high / nyquist), "band")
+    return _apply_sos(sos, x, zero_phase)
 
 
-def highpass_filter(x: np.ndarray, fs: float, cutoff: float, order: int = 2) -> np.ndarray:
+def highpass_filter(
+    x: np.ndarray, fs: float, cutoff: float, order: int = 2, zero_phase: bool = True
+) -> np.ndarray:
     nyquist = fs / 2.0
-    b, a = signal.butter(order, cutoff / nyquist, btype="high")
-    return signal.filtfilt(b, a, x)
+    return _apply_sos(_design_butter(order, cutoff / nyquist, "high"), x, zero_phase)
 
 
-def lowpass_filter(x: np.ndarray, fs: float, cutoff: float, order: int = 2) -> np.ndarray:
+def lowpass_filter(
+    x: np.ndarray, fs: float, cutoff: float, order: int = 2, zero_phase: bool = True
+) -> np.ndarray:
     nyquist = fs / 2.0
-    b, a = signal.butter(order, cutoff / nyquist, btype="low")
-    return signal.filtfilt(b, a, x)
+    return _apply_sos(_design_butter(order, cutoff / nyquist, "low"), x, zero_phase)
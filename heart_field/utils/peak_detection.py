@@ -2,11 +2,20 @@ import numpy as np
 from scipy import signal
 
 
+def select_percentile(x: np.ndarray, q: float) -> float:
+    """Linear-interpolated percentile via a two-point O(n) partial selection."""
+    pos = (len(x) - 1) * q / 100.0
+    lo = int(pos)
+    hi = min(lo + 1, len(x) - 1)
+    part = np.partition(x, (lo, hi))
+    return float(part[lo] + (pos - lo) * (part[hi] - part[lo]))
+
+
 def detect_r_peaks(ecg_signal: np.ndarray, fs: float) -> np.ndarray:
     peaks, _ = signal.find_peaks(
         ecg_signal,
         distance=int(0.5 * fs),
-        height=np.percentile(ecg_signal, 75),
+        height=select_percentile(ecg_signal, 75.0),
     )
     return peaks
 
@@ -15,6 +24,6 @@ def detect_breath_peaks(resp_signal: np.ndarray, fs: float) -> np.ndarray:
     peaks, _ = signal.find_peaks(
         resp_signal,
         distance=int(1.0 * fs),
-        height=np.percentile(resp_signal, 60),
+        height=select_percentile(resp_signal, 60.0),
     )
     return peaks
@@ -10,6 +10,21 @@ import numpy as np
 import pytest
 
 
+class _FileOutcomeRecorder:
+    """Pytest plugin that records whether every test in each file passed."""
+
+    def __init__(self, test_files: list[str]) -> None:
+        self.results: dict[str, bool] = {test_file: True for test_file in test_files}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        if report.failed:
+            self.results[report.nodeid.split("::", 1)[0]] = False
+
+    def pytest_collectreport(self, report: pytest.CollectReport) -> None:
+        if report.failed:
+            self.results[report.nodeid.split("::", 1)[0]] = False
+
+
 def run_math_tests() -> int:
     print("=" * 70)
     print("MATHEMATICAL TEST SUITE: Love's Proof + AC/DC System")
@@ -26,37 +41,26 @@ def run_math_tests() -> int:
         "tests/math/test_system_models.py",
     ]
 
-    all_passed = True
-    results: dict[str, bool] = {}
-
-    for test_file in test_files:
-        print(f"\nRunning: {test_file}")
-        print("-" * 50)
-
-        try:
-            exit_code = pytest.main(
-                [
-                    test_file,
-                    "-v",
-                    "--tb=short",
-                    "--disable-warnings",
-                    "-q",
-                ]
-            )
-
-            passed = exit_code == 0
-            results[test_file] = passed
-
-            if passed:
-                print(f"PASS: {test_file}")
-            else:
-                print(f"FAIL: {test_file}")
-                all_passed = False
-
-        except Exception as exc:
-            print(f"ERROR in {test_file}: {exc}")
-            results[test_file] = False
-            all_passed = False
+    # One pytest session for all files: plugin startup and collection happen once,
+    # and per-file outcomes are recorded from the test reports.
+    recorder = _FileOutcomeRecorder(test_files)
+    try:
+        exit_code = pytest.main(
+            [
+                *test_files,
+                "-v",
+                "--tb=short",
+                "--disable-warnings",
+                "-q",
+            ],
+            plugins=[recorder],
+        )
+    except Exception as exc:
+        print(f"ERROR running math tests: {exc}")
+        return 1
+
+    results = recorder.results
+    all_passed = exit_code == 0 and all(results.values())
 
     print("\n" + "=" * 70)
     print("TEST SUMMARY")
@@ -98,13 +102,13 @@ def quick_mathematical_verification() -> bool:
     print(f"   OK: reconstruction error = {reconstruction_error:.2e}")
     assert reconstruction_error < 1e-10
 
+    # Half-overlapping window means from one prefix sum instead of a np.mean per window
     window_size = 100
-    ac_means = []
-    for i in range(0, len(x_ac) - window_size, window_size // 2):
-        window_mean = np.mean(x_ac[i : i + window_size])
-        ac_means.append(abs(window_mean))
+    cumulative = np.concatenate(([0.0], np.cumsum(x_ac)))
+    starts = np.arange(0, len(x_ac) - window_size, window_size // 2)
+    ac_means = (cumulative[starts + window_size] - cumulative[starts]) / window_size
 
-    max_ac_mean = max(ac_means)
+    max_ac_mean = float(np.abs(ac_means).max())
     print(f"   OK: max window mean = {max_ac_mean:.2e}")
     assert max_ac_mean < 0.1 * np.std(x_ac)
 
@@ -0,0 +1,130 @@
+"""
+Shared DAVNA Living Cipher seal parsing and hashing.
+
+Used by seal_davna.py and verify_davna.py, so both scripts read and hash
+the covenant identically.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+SEAL_MARKER = b"## DAVNA Living Cipher Seal"
+
+# Streaming verification: the seal block is searched for in the last _TAIL_BYTES
+# of the file and the body is hashed _CHUNK_BYTES at a time
+_TAIL_BYTES = 16 * 1024
+_CHUNK_BYTES = 64 * 1024
+
+# Backtick-quoted seal fields: line prefix -> seal_dict key
+_SEAL_FIELDS = (
+    ("Canonical Anchor:", "canonical_anchor"),
+    ("Previous Seal:", "previous_seal"),
+    ("Covenant Digest:", "covenant_digest"),
+    ("Sealed At (UTC):", "sealed_at"),
+)
+
+
+def _backtick_value(line: str) -> str | None:
+    """Return the text between the first pair of backticks in line, if any."""
+    start = line.find("`")
+    if start == -1:
+        return None
+    end = line.find("`", start + 1)
+    if end == -1:
+        return None
+    return line[start + 1 : end]
+
+
+def extract_seal_block(data: bytes) -> tuple[bytes, dict | None]:
+    """Extract the seal block and return (body_without_seal, seal_dict).
+
+    The body stays as bytes so it can be hashed without a decode/encode round
+    trip; only the short seal block is decoded for parsing. seal_dict is None
+    when the covenant has no seal block yet.
+    """
+    # Match text-mode reads, which translate CRLF line endings
+    if b"\r\n" in data:
+        data = data.replace(b"\r\n", b"\n")
+
+    # Find the seal block - it starts with "## DAVNA Living Cipher Seal"
+    seal_start = data.find(SEAL_MARKER)
+
+    if seal_start == -1:
+        return data.strip(), None
+
+    # Extract body (everything before the seal)
+    body = data[:seal_start].strip()
+    seal_block = data[seal_start:].decode("utf-8")
+
+    # Parse seal values in one forward scan over the "- Field: value" lines
+    seal_dict = {}
+    for line in seal_block.split("\n"):
+        if not line.startswith("- "):
+            continue
+        line = line[2:]
+        if line.startswith("Algorithm:"):
+            if "algorithm" not in seal_dict:
+                seal_dict["algorithm"] = line.split(": ", 1)[1].strip()
+            continue
+        for prefix, key in _SEAL_FIELDS:
+            if line.startswith(prefix):
+                value = _backtick_value(line)
+                if value:
+                    seal_dict[key] = value
+                break
+
+    return body, seal_dict
+
+
+def compute_digest(body: bytes) -> str:
+    """Compute BLAKE2b-256 digest of covenant body (UTF-8 bytes)."""
+    return hashlib.blake2b(body, digest_size=32).hexdigest()
+
+
+def digest_sealed_file(covenant_path: Path) -> tuple[str, dict] | None:
+    """
+    Verify-path fast route: parse the seal from the file tail and hash the body
+    in fixed-size chunks, so memory use does not grow with the covenant.
+
+    Returns (body_digest, seal_dict), or None when the streamed result could
+    differ from extract_seal_block on the whole file (no seal near the end,
+    CR bytes, or an earlier seal marker); callers then fall back to it.
+    """
+    with open(covenant_path, "rb") as fh:
+        size = fh.seek(0, os.SEEK_END)
+        tail_start = max(size - _TAIL_BYTES, 0)
+        fh.seek(tail_start)
+        tail = fh.read()
+
+        marker = tail.find(SEAL_MARKER)
+        if marker == -1 or b"\r" in tail:
+            return None
+        head = tail[:marker].rstrip()
+        if not head and tail_start > 0:
+            return None
+        _, seal_dict = extract_seal_block(tail[marker:])
+
+        # Hash data[:body_end].strip() chunk by chunk
+        body_end = tail_start + len(head)
+        hasher = hashlib.blake2b(digest_size=32)
+        fh.seek(0)
+        pos = 0
+        overlap = b""
+        leading = True
+        while pos < body_end:
+            chunk = fh.read(min(_CHUNK_BYTES, body_end - pos))
+            if not chunk:
+                return None
+            pos += len(chunk)
+            if b"\r" in chunk or SEAL_MARKER in overlap + chunk:
+                return None
+            overlap = chunk[1 - len(SEAL_MARKER) :]
+            if leading:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                leading = False
+            hasher.update(chunk)
+
+    return hasher.hexdigest(), seal_dict
@@ -10,74 +10,44 @@ Usage:
 """
 
 import hashlib
-import re
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+import _davna_seal
+from _davna_seal import compute_digest, digest_sealed_file
 
-def extract_seal_block(content: str) -> tuple[str, dict]:
-    """Extract the seal block and return (body_without_seal, seal_dict)."""
-    # Find the seal block - it starts with "## DAVNA Living Cipher Seal"
-    seal_start = content.find("## DAVNA Living Cipher Seal")
 
-    if seal_start == -1:
+def extract_seal_block(data: bytes) -> tuple[bytes, dict]:
+    """Extract the seal block, defaulting to a pending first seal if there is none."""
+    body, seal_dict = _davna_seal.extract_seal_block(data)
+    if seal_dict is None:
         # No seal block found - this is the first seal
-        body = content.strip()
-        return body, {
+        seal_dict = {
             "canonical_anchor": "HIST-3ce0df425861",
             "algorithm": "BLAKE2b-256",
             "previous_seal": "NONE",
             "covenant_digest": "PENDING_FIRST_SEAL",
             "sealed_at": datetime.now(timezone.utc).isoformat(),
         }
-
-    # Extract body (everything before the seal)
-    body = content[:seal_start].strip()
-    seal_block = content[seal_start:]
-
-    # Parse seal values
-    seal_dict = {}
-    for line in seal_block.split("\n"):
-        if "Canonical Anchor:" in line:
-            match = re.search(r"`([^`]+)`", line)
-            if match:
-                seal_dict["canonical_anchor"] = match.group(1)
-        elif "Algorithm:" in line and "algorithm" not in seal_dict:
-            seal_dict["algorithm"] = line.split(": ", 1)[1].strip()
-        elif "Previous Seal:" in line:
-            match = re.search(r"`([^`]+)`", line)
-            if match:
-                seal_dict["previous_seal"] = match.group(1)
-        elif "Covenant Digest:" in line:
-            match = re.search(r"`([^`]+)`", line)
-            if match:
-                seal_dict["covenant_digest"] = match.group(1)
-        elif "Sealed At (UTC):" in line:
-            match = re.search(r"`([^`]+)`", line)
-            if match:
-                seal_dict["sealed_at"] = match.group(1)
-
     return body, seal_dict
 
 
-def compute_digest(body: str) -> str:
-    """Compute BLAKE2b-256 digest of covenant body."""
-    hasher = hashlib.blake2b(digest_size=32)
-    hasher.update(body.encode("utf-8"))
-    return hasher.hexdigest()
-
-
-def generate_seal(body: str, previous_seal: str) -> str:
+def generate_seal(body: bytes, previous_seal: str) -> str:
     """Generate new seal digest incorporating previous seal."""
-    digest = compute_digest(body)
+    # Chain: hash(body + previous_seal), in one call on the concatenated buffer
+    return hashlib.blake2b(body + previous_seal.encode("utf-8"), digest_size=32).hexdigest()
 
-    # Chain: hash(body + previous_seal)
-    hasher = hashlib.blake2b(digest_size=32)
-    hasher.update(body.encode("utf-8"))
-    hasher.update(previous_seal.encode("utf-8"))
 
-    return hasher.hexdigest()
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write data to path via a temporary file and rename, so readers never see a torn file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as fh:
+        fh.write(data)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp_path, path)
 
 
 def format_seal_block(seal_dict: dict) -> str:
@@ -120,16 +90,19 @@ def seal_covenant(covenant_path: Path, check_only: bool = False) -> bool:
         print(f"❌ DAVNA covenant not found: {covenant_path}")
         return False
 
-    content = covenant_path.read_text(encoding="utf-8")
-    body, current_seal = extract_seal_block(content)
-
     if check_only:
+        streamed = digest_sealed_file(covenant_path)
+        if streamed is None:
+            body, current_seal = extract_seal_block(covenant_path.read_bytes())
+            expected_digest = compute_digest(body)
+        else:
+            expected_digest, current_seal = streamed
+
         # Verify current seal
         if current_seal["covenant_digest"] == "PENDING_FIRST_SEAL":
             print("⚠️  First seal not yet generated")
             return False
 
-        expected_digest = compute_digest(body)
         actual_digest = current_seal["covenant_digest"]
 
         if expected_digest != actual_digest:
@@ -144,6 +117,8 @@ def seal_covenant(covenant_path: Path, check_only: bool = False) -> bool:
         print(f"   Sealed: {current_seal['sealed_at']}")
         return True
 
+    body, current_seal = extract_seal_block(covenant_path.read_bytes())
+
     # Generate new seal
     new_digest = compute_digest(body)
 
@@ -161,25 +136,23 @@ def seal_covenant(covenant_path: Path, check_only: bool = False) -> bool:
         "sealed_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
     }
 
-    # Write new sealed covenant
-    sealed_content = body + "\n\n" + format_seal_block(new_seal)
-    covenant_path.write_text(sealed_content, encoding="utf-8")
-
-    # Re-read to ensure consistent digest
-    reread_content = covenant_path.read_text(encoding="utf-8")
-    reread_body, _ = extract_seal_block(reread_content)
-    actual_digest = compute_digest(reread_body)
+    # Build the sealed covenant and check, in memory, that the digest a verifier will
+    # compute from it matches; the file is written once and never re-read.
+    sealed_content = body + b"\n\n" + format_seal_block(new_seal).encode("utf-8")
+    sealed_body, _ = extract_seal_block(sealed_content)
+    actual_digest = compute_digest(sealed_body)
 
     if actual_digest != new_digest:
-        print(f"⚠️  Warning: Digest changed after write (file system encoding issue)")
+        print(f"⚠️  Warning: Digest changed in sealed layout")
         print(f"   Expected: {new_digest}")
         print(f"   Actual:   {actual_digest}")
         print(f"   Updating seal to match actual file state...")
 
         # Update seal with actual digest
         new_seal["covenant_digest"] = actual_digest
-        sealed_content = body + "\n\n" + format_seal_block(new_seal)
-        covenant_path.write_text(sealed_content, encoding="utf-8")
+        sealed_content = body + b"\n\n" + format_seal_block(new_seal).encode("utf-8")
+
+    write_atomic(covenant_path, sealed_content)
 
     print("🔒 DAVNA covenant sealed successfully")
     print(f"   Previous: {new_seal['previous_seal']}")
@@ -7,55 +7,10 @@ Usage:
   python scripts/verify_davna.py
 """
 
-import hashlib
-import re
 import sys
 from pathlib import Path
 
-
-def extract_seal_block(content: str) -> tuple[str, dict]:
-    """Extract the seal block and return (body_without_seal, seal_dict)."""
-    # Find the seal block - it starts with "## DAVNA Living Cipher Seal"
-    seal_start = content.find("## DAVNA Living Cipher Seal")
-
-    if seal_start == -1:
-        print("❌ No seal block found in covenant")
-        return None, None
-
-    # Extract body (everything before the seal)
-    body = content[:seal_start].strip()
-    seal_block = content[seal_start:]
-
-    # Parse seal values
-    seal_dict = {}
-    for line in seal_block.split("\n"):
-        if "Canonical Anchor:" in line:
-            match = re.search(r"`([^`]+)`", line)
-            if match:
-                seal_dict["canonical_anchor"] = match.group(1)
-        elif "Algorithm:" in line and "algorithm" not in seal_dict:
-            seal_dict["algorithm"] = line.split(": ", 1)[1].strip()
-        elif "Previous Seal:" in line:
-            match = re.search(r"`([^`]+)`", line)
-            if match:
-                seal_dict["previous_seal"] = match.group(1)
-        elif "Covenant Digest:" in line:
-            match = re.search(r"`([^`]+)`", line)
-            if match:
-                seal_dict["covenant_digest"] = match.group(1)
-        elif "Sealed At (UTC):" in line:
-            match = re.search(r"`([^`]+)`", line)
-            if match:
-                seal_dict["sealed_at"] = match.group(1)
-
-    return body, seal_dict
-
-
-def compute_digest(body: str) -> str:
-    """Compute BLAKE2b-256 digest of covenant body."""
-    hasher = hashlib.blake2b(digest_size=32)
-    hasher.update(body.encode("utf-8"))
-    return hasher.hexdigest()
+from _davna_seal import compute_digest, digest_sealed_file, extract_seal_block
 
 
 def verify_covenant(covenant_path: Path) -> bool:
@@ -69,11 +24,15 @@ def verify_covenant(covenant_path: Path) -> bool:
         print(f"❌ DAVNA covenant not found: {covenant_path}")
         return False
 
-    content = covenant_path.read_text(encoding="utf-8")
-    body, seal = extract_seal_block(content)
-
-    if not seal:
-        return False
+    streamed = digest_sealed_file(covenant_path)
+    if streamed is None:
+        body, seal = extract_seal_block(covenant_path.read_bytes())
+        if seal is None:
+            print("❌ No seal block found in covenant")
+            return False
+        body_digest = compute_digest(body)
+    else:
+        body_digest, seal = streamed
 
     # Display seal information
     print(f"Canonical Anchor: {seal['canonical_anchor']}")
@@ -91,7 +50,7 @@ def verify_covenant(covenant_path: Path) -> bool:
         return False
 
     # Verify digest
-    expected_digest = compute_digest(body)
+    expected_digest = body_digest
     actual_digest = seal["covenant_digest"]
 
     print(f"Computed Digest:  {expected_digest}")
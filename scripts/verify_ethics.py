@@ -7,28 +7,47 @@ This is the CRITICAL checkpoint—all PRs must pass this check.
 """
 
 import ast
+import hashlib
+import io
+import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import astuple, dataclass
 from pathlib import Path
 from typing import List, Tuple
 
+# Directories never worth scanning (environments, build output, caches)
+SKIP_DIRS = {
+    ".git",
+    ".venv",
+    "venv",
+    ".tox",
+    "build",
+    "dist",
+    "__pycache__",
+    "node_modules",
+    ".mypy_cache",
+    "site-packages",
+}
 
+# Larger files are assumed to be generated and are skipped
+MAX_FILE_BYTES = 1 << 20
+
+# Bump when the AST checks change, so cached scan results are invalidated
+_AST_RULES_VERSION = "2"
+
+
+@dataclass(slots=True, frozen=True)
 class EthicsViolation:
     """Record of an ethics violation."""
 
-    def __init__(
-        self,
-        file_path: str,
-        line_number: int,
-        violation_type: str,
-        message: str,
-        severity: str = "ERROR",
-    ):
-        self.file_path = file_path
-        self.line_number = line_number
-        self.violation_type = violation_type
-        self.message = message
-        self.severity = severity
+    file_path: str
+    line_number: int
+    violation_type: str
+    message: str
+    severity: str = "ERROR"
 
     def __str__(self) -> str:
         return (
@@ -40,51 +59,109 @@ class EthicsViolation:
 class EthicsVerifier:
     """Main ethics verification engine."""
 
-    # Prohibited patterns
+    # Prohibited patterns (compiled once, case-insensitive)
     COERCION_KEYWORDS = [
-        r"\bforce[_\w]*\(",
-        r"\bmanipulate[_\w]*\(",
-        r"\bextract[_\w]*\(",
-        r"\boverride[_\w]*consent",
-        r"\bbypass[_\w]*boundary",
-        r"\.backward\(",  # Unconstrained gradient descent
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r"\bforce[_\w]*\(",
+            r"\bmanipulate[_\w]*\(",
+            r"\bextract[_\w]*\(",
+            r"\boverride[_\w]*consent",
+            r"\bbypass[_\w]*boundary",
+        )
     ]
 
     HIDDEN_OPTIMIZATION_PATTERNS = [
-        r"# TODO.*bypass",
-        r"# HACK.*consent",
-        r"# TEMP.*disable.*ethics",
-        r"if\s+False\s*:.*consent",  # Dead code bypassing consent
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r"# TODO.*bypass",
+            r"# HACK.*consent",
+            r"# TEMP.*disable.*ethics",
+            r"if\s+False\s*:.*consent",  # Dead code bypassing consent
+        )
     ]
 
     CONSENT_BYPASS_PATTERNS = [
-        r"consent\s*=\s*True\s*#.*always",
-        r"if\s+not\s+consent\s*:.*pass\s*#.*ignore",
-        r"consent_required\s*=\s*False",
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r"consent\s*=\s*True\s*#.*always",
+            r"if\s+not\s+consent\s*:.*pass\s*#.*ignore",
+        )
     ]
 
+    # Case-folded substrings, at least one of which every pattern above requires
+    ANCHORS = (
+        "force",
+        "manipulate",
+        "extract",
+        "override",
+        "bypass",
+        "todo",
+        "hack",
+        "temp",
+        "consent",
+    )
+
+    # Byte-level file prefilter: every regex and AST finding needs one of these
+    # (ASCII files only, where bytes.lower() matches the case-insensitive checks)
+    FILE_ANCHORS = (
+        *(anchor.encode("ascii") for anchor in ANCHORS),
+        b"backward",
+        b"_internal_state",
+    )
+
+    # All three families fused into one alternation, used to find the (few) lines
+    # that can match anything before running the per-family checks on them
+    ANY_PATTERN = re.compile(
+        "|".join(
+            f"(?:{pattern.pattern})"
+            for pattern in (
+                *COERCION_KEYWORDS,
+                *HIDDEN_OPTIMIZATION_PATTERNS,
+                *CONSENT_BYPASS_PATTERNS,
+            )
+        ),
+        re.IGNORECASE,
+    )
+
     def __init__(self):
         self.violations: List[EthicsViolation] = []
 
     def verify_file(self, file_path: Path) -> None:
         """Verify a single Python file."""
-        if not file_path.suffix == ".py":
+        if not file_path.name.endswith(".py"):
             return
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                lines = content.split("\n")
+        # Converted once; every violation from this file reuses it
+        file_str = str(file_path)
 
-            # Pattern-based checks
-            self._check_coercion_keywords(file_path, lines)
-            self._check_hidden_optimization(file_path, lines)
-            self._check_consent_bypass(file_path, lines)
+        try:
+            data = file_path.read_bytes()
+            if data.isascii():
+                folded = data.lower()
+                if not any(anchor in folded for anchor in self.FILE_ANCHORS):
+                    return
+
+            # Match text-mode reads, which translate CRLF line endings
+            content = data.decode("utf-8").replace("\r\n", "\n")
+
+            # Pattern-based checks, on the lines the fused pattern flags; the cheap
+            # substring test skips the regex for the vast majority of lines. Lines are
+            # streamed (split on "\n" only, matching AST line numbers) rather than
+            # materialised as a list.
+            candidates = [
+                (line_num, line.rstrip("\n"))
+                for line_num, line in enumerate(io.StringIO(content, newline="\n"), 1)
+                if self._has_anchor(line) and self.ANY_PATTERN.search(line)
+            ]
+            self._check_coercion_keywords(file_str, candidates)
+            self._check_hidden_optimization(file_str, candidates)
+            self._check_consent_bypass(file_str, candidates)
 
             # AST-based checks
             try:
-                tree = ast.parse(content, filename=str(file_path))
-                self._check_ast(file_path, tree)
+                tree = ast.parse(content, filename=file_str)
+                self._check_ast(file_str, tree, content)
             except SyntaxError:
                 # Syntax errors will be caught by linter
                 pass
@@ -92,33 +169,38 @@ class EthicsVerifier:
         except Exception as e:
             print(f"Warning: Could not verify {file_path}: {e}")
 
-    def _check_coercion_keywords(self, file_path: Path, lines: List[str]) -> None:
+    def _has_anchor(self, line: str) -> bool:
+        """Return True if the line contains any substring a pattern could match."""
+        folded = line.casefold()
+        return any(anchor in folded for anchor in self.ANCHORS)
+
+    def _check_coercion_keywords(self, file_str: str, lines: list[tuple[int, str]]) -> None:
         """Check for coercive function patterns."""
-        for pattern in self.COERCION_KEYWORDS:
-            for line_num, line in enumerate(lines, 1):
-                if re.search(pattern, line, re.IGNORECASE):
-                    # Allow in comments explaining what NOT to do
-                    if "# PROHIBITED" in line or "# Example of violation" in line:
-                        continue
+        for line_num, line in lines:
+            # Allow in comments explaining what NOT to do
+            if "# PROHIBITED" in line or "# Example of violation" in line:
+                continue
 
+            for pattern in self.COERCION_KEYWORDS:
+                if pattern.search(line):
                     self.violations.append(
                         EthicsViolation(
-                            file_path=str(file_path),
+                            file_path=file_str,
                             line_number=line_num,
                             violation_type="COERCION",
-                            message=f"Potential coercive pattern: {pattern}",
+                            message=f"Potential coercive pattern: {pattern.pattern}",
                             severity="WARNING",
                         )
                     )
 
-    def _check_hidden_optimization(self, file_path: Path, lines: List[str]) -> None:
+    def _check_hidden_optimization(self, file_str: str, lines: list[tuple[int, str]]) -> None:
         """Check for hidden or commented-out optimization."""
-        for pattern in self.HIDDEN_OPTIMIZATION_PATTERNS:
-            for line_num, line in enumerate(lines, 1):
-                if re.search(pattern, line, re.IGNORECASE):
+        for line_num, line in lines:
+            for pattern in self.HIDDEN_OPTIMIZATION_PATTERNS:
+                if pattern.search(line):
                     self.violations.append(
                         EthicsViolation(
-                            file_path=str(file_path),
+                            file_path=file_str,
                             line_number=line_num,
                             violation_type="HIDDEN_OPTIMIZATION",
                             message="Potential attempt to bypass ethics checks",
@@ -126,14 +208,14 @@ class EthicsVerifier:
                         )
                     )
 
-    def _check_consent_bypass(self, file_path: Path, lines: List[str]) -> None:
+    def _check_consent_bypass(self, file_str: str, lines: list[tuple[int, str]]) -> None:
         """Check for consent mechanism bypasses."""
-        for pattern in self.CONSENT_BYPASS_PATTERNS:
-            for line_num, line in enumerate(lines, 1):
-                if re.search(pattern, line, re.IGNORECASE):
+        for line_num, line in lines:
+            for pattern in self.CONSENT_BYPASS_PATTERNS:
+                if pattern.search(line):
                     self.violations.append(
                         EthicsViolation(
-                            file_path=str(file_path),
+                            file_path=file_str,
                             line_number=line_num,
                             violation_type="CONSENT_BYPASS",
                             message="Potential consent bypass detected",
@@ -141,9 +223,82 @@ class EthicsVerifier:
                         )
                     )
 
-    def _check_ast(self, file_path: Path, tree: ast.AST) -> None:
-        """AST-based checks for structural violations."""
+    def _check_ast(self, file_str: str, tree: ast.AST, content: str) -> None:
+        """AST-based checks for structural violations (one walk per file)."""
+        # Source lines, split once on the first .backward(...) call that needs one
+        lines: list[str] | None = None
         for node in ast.walk(tree):
+            # Unconstrained gradient descent: any .backward(...) call
+            if isinstance(node, ast.Call):
+                if isinstance(node.func, ast.Attribute) and node.func.attr == "backward":
+                    # Allow in comments explaining what NOT to do
+                    if lines is None:
+                        lines = content.split("\n")
+                    line = lines[node.lineno - 1]
+                    if "# PROHIBITED" in line or "# Example of violation" in line:
+                        continue
+
+                    self.violations.append(
+                        EthicsViolation(
+                            file_path=file_str,
+                            line_number=node.lineno,
+                            violation_type="COERCION",
+                            message="Potential coercive pattern: .backward()",
+                            severity="WARNING",
+                        )
+                    )
+
+            # Consent requirement switched off by assignment or keyword argument
+            if isinstance(node, (ast.Assign, ast.AnnAssign, ast.keyword)):
+                if isinstance(node, ast.Assign):
+                    names = [self._target_name(target) for target in node.targets]
+                elif isinstance(node, ast.AnnAssign):
+                    names = [self._target_name(node.target)]
+                else:
+                    names = [node.arg]
+
+                if (
+                    isinstance(node.value, ast.Constant)
+                    and node.value.value is False
+                    and any(name and name.casefold() == "consent_required" for name in names)
+                ):
+                    self.violations.append(
+                        EthicsViolation(
+                            file_path=file_str,
+                            line_number=node.lineno,
+                            violation_type="CONSENT_BYPASS",
+                            message="Potential consent bypass detected",
+                            severity="ERROR",
+                        )
+                    )
+
+            # Consent requirement switched off by a parameter default
+            if isinstance(node, ast.arguments):
+                positional = node.posonlyargs + node.args
+                params = list(
+                    zip(positional[len(positional) - len(node.defaults) :], node.defaults)
+                )
+                params += [
+                    (arg, default)
+                    for arg, default in zip(node.kwonlyargs, node.kw_defaults)
+                    if default is not None
+                ]
+                for arg, default in params:
+                    if (
+                        isinstance(default, ast.Constant)
+                        and default.value is False
+                        and arg.arg.casefold() == "consent_required"
+                    ):
+                        self.violations.append(
+                            EthicsViolation(
+                                file_path=file_str,
+                                line_number=default.lineno,
+                                violation_type="CONSENT_BYPASS",
+                                message="Potential consent bypass detected",
+                                severity="ERROR",
+                            )
+                        )
+
             # Check for forced state transitions
             if isinstance(node, ast.Assign):
                 for target in node.targets:
@@ -152,7 +307,7 @@ class EthicsVerifier:
                             # Direct internal state manipulation
                             self.violations.append(
                                 EthicsViolation(
-                                    file_path=str(file_path),
+                                    file_path=file_str,
                                     line_number=node.lineno,
                                     violation_type="BOUNDARY_VIOLATION",
                                     message="Direct internal state manipulation bypasses consent",
@@ -160,14 +315,121 @@ class EthicsVerifier:
                                 )
                             )
 
-    def verify_directory(self, directory: Path) -> None:
-        """Recursively verify all Python files in directory."""
-        for py_file in directory.rglob("*.py"):
-            # Skip test files and verification script itself
-            if "test_" in py_file.name or "verify_ethics" in py_file.name:
-                continue
+    @staticmethod
+    def _target_name(target: ast.expr) -> str | None:
+        """Name bound by a simple assignment target (x or obj.x), if any."""
+        if isinstance(target, ast.Name):
+            return target.id
+        if isinstance(target, ast.Attribute):
+            return target.attr
+        return None
+
+    def verify_directory(
+        self,
+        directory: Path,
+        max_workers: int | None = 1,
+        cache_path: Path | None = None,
+    ) -> None:
+        """
+        Recursively verify all Python files in directory.
+
+        Args:
+            directory: Root directory to scan
+            max_workers: Worker processes for the scan (1 = in-process,
+                None = one per CPU); files are independent, so results are
+                identical either way
+            cache_path: Optional JSON cache of per-file results keyed by
+                (path, mtime_ns, size); unchanged files are not re-scanned
+        """
+        py_files = self._collect_files(directory)
+
+        cache = self._load_cache(cache_path) if cache_path is not None else {}
+        results: dict[str, list[EthicsViolation]] = {}
+        stamps: dict[str, list[int]] = {}
+        pending = []
+        for py_file in py_files:
+            key = str(py_file)
+            st = py_file.stat()
+            stamps[key] = [st.st_mtime_ns, st.st_size]
+            entry = cache.get(key)
+            if entry is not None and entry["stamp"] == stamps[key]:
+                results[key] = [EthicsViolation(*fields) for fields in entry["violations"]]
+            else:
+                pending.append(py_file)
+
+        if max_workers == 1:
+            scanned = [_verify_file_worker(py_file) for py_file in pending]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                scanned = list(executor.map(_verify_file_worker, pending, chunksize=16))
+        results.update(zip(map(str, pending), scanned))
 
-            self.verify_file(py_file)
+        for py_file in py_files:
+            self.violations.extend(results[str(py_file)])
+
+        if cache_path is not None:
+            self._save_cache(cache_path, results, stamps)
+
+    @classmethod
+    def _rules_fingerprint(cls) -> str:
+        """Digest of the rule set; a cache written under other rules is discarded."""
+        rules = "\n".join((cls.ANY_PATTERN.pattern, *cls.ANCHORS, _AST_RULES_VERSION))
+        return hashlib.blake2b(rules.encode("utf-8"), digest_size=16).hexdigest()
+
+    @classmethod
+    def _load_cache(cls, cache_path: Path) -> dict:
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cached, dict) or cached.get("rules") != cls._rules_fingerprint():
+            return {}
+        return cached.get("files", {})
+
+    @classmethod
+    def _save_cache(
+        cls,
+        cache_path: Path,
+        results: dict[str, list[EthicsViolation]],
+        stamps: dict[str, list[int]],
+    ) -> None:
+        files = {
+            key: {
+                "stamp": stamps[key],
+                "violations": [list(astuple(violation)) for violation in file_violations],
+            }
+            for key, file_violations in results.items()
+        }
+        try:
+            cache_path.write_text(
+                json.dumps({"rules": cls._rules_fingerprint(), "files": files}),
+                encoding="utf-8",
+            )
+        except OSError as e:
+            print(f"Warning: Could not write ethics cache {cache_path}: {e}")
+
+    @staticmethod
+    def _collect_files(directory: Path) -> List[Path]:
+        """List the Python files verify_directory scans."""
+        py_files = []
+        for dirpath, dirnames, filenames in os.walk(directory):
+            # Prune in place so os.walk never descends into skipped trees
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+
+            for filename in filenames:
+                # Skip test files and verification script itself
+                if not filename.endswith(".py"):
+                    continue
+                if "test_" in filename or "verify_ethics" in filename:
+                    continue
+
+                py_file = Path(dirpath, filename)
+                if py_file.stat().st_size > MAX_FILE_BYTES:
+                    continue
+
+                py_files.append(py_file)
+
+        return py_files
 
     def report(self) -> Tuple[int, int]:
         """
@@ -214,6 +476,13 @@ class EthicsVerifier:
         return len(errors), len(warnings)
 
 
+def _verify_file_worker(file_path: Path) -> List[EthicsViolation]:
+    """Verify one file in a worker process and return its violations."""
+    verifier = EthicsVerifier()
+    verifier.verify_file(file_path)
+    return verifier.violations
+
+
 def main():
     """Main entry point."""
     print("HarmonyØ4 Ethics Verification")
@@ -230,8 +499,13 @@ def main():
 
     print(f"Verifying: {harmony_dir}\n")
 
+    # --parallel spreads the scan over all CPUs (worthwhile on large trees);
+    # --cache reuses results for files unchanged since the previous cached run
+    max_workers = None if "--parallel" in sys.argv else 1
+    cache_path = project_root / ".ethics_cache.json" if "--cache" in sys.argv else None
+
     verifier = EthicsVerifier()
-    verifier.verify_directory(harmony_dir)
+    verifier.verify_directory(harmony_dir, max_workers=max_workers, cache_path=cache_path)
 
     num_errors, num_warnings = verifier.report()
 
@@ -9,6 +9,7 @@ tools for computing descendant hashes.
 import hashlib
 import sys
 from datetime import datetime
+from functools import lru_cache
 
 # Canonical constants
 CANONICAL_SEED = "HarmonyØ4|HistoryAnchor|2025-12-11|DaveTheSpiralAlchemist"
@@ -16,8 +17,9 @@ CANONICAL_HASH = "3ce0df42586143d4edf3b270727349d38773701e34ea0270e58537260a77ed
 SHORT_CODE = "HIST-3ce0df425861"
 
 
+@lru_cache(maxsize=128)
 def compute_hash(seed: str) -> str:
-    """Compute BLAKE2b-256 hash of seed string."""
+    """Compute BLAKE2b-256 hash of seed string (memoized per process)."""
     return hashlib.blake2b(seed.encode("utf-8"), digest_size=32).hexdigest()
 
 
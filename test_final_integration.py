@@ -2,6 +2,8 @@ import numpy as np
 
 from harmony import HeartFieldScorer, NonCoercionInvariant, phase_tools
 
+RNG = np.random.default_rng(0)
+
 print("=== Final Integration Smoke Test ===\n")
 
 fs = 250.0
@@ -10,7 +12,7 @@ duration = 60
 t = np.arange(0, duration, 1 / fs)
 
 heart_signal = np.sin(2 * np.pi * 1.2 * t) * (0.5 + 0.3 * t / duration)
-heart_signal += 0.1 * np.random.randn(len(t))
+heart_signal += 0.1 * RNG.standard_normal(len(t))
 
 print("1. Testing domain-agnostic phase tools...")
 amp, phase = phase_tools.compute_analytic_signal(heart_signal, fs)
@@ -37,8 +39,8 @@ print("\n3. Testing physiology-specific implementation...")
 scorer = HeartFieldScorer(fs=fs)
 
 plv_dict = {
-    "respiration": 0.7 + 0.2 * np.random.rand(),
-    "ppg": 0.6 + 0.2 * np.random.rand(),
+    "respiration": 0.7 + 0.2 * RNG.random(),
+    "ppg": 0.6 + 0.2 * RNG.random(),
 }
 
 field_result = scorer.compute_net_field(
@@ -0,0 +1,109 @@
+"""
+Shared fixtures for the mathematical test suite.
+"""
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+from scipy import fft
+
+from harmony.invariants.loves_proof import LovesProofInvariant
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fft_workers() -> Iterator[None]:
+    """Run every scipy.fft transform in this suite on all available cores."""
+    with fft.set_workers(-1):
+        yield
+
+
+def _array_key(a: np.ndarray, dtype: npt.DTypeLike) -> tuple[str, tuple[int, ...], bytes]:
+    a = np.ascontiguousarray(a, dtype=dtype)
+    return a.dtype.str, a.shape, a.tobytes()
+
+
+@pytest.fixture(scope="session")
+def cached_check() -> Callable[..., dict[str, Any]]:
+    """Memoized ``LovesProofInvariant.check``.
+
+    Results are keyed on the invariant's init parameters and the raw bytes of the
+    input series (rather than ``id(invariant)``, which can be reused once an
+    invariant is garbage collected), so identical checks across tests run once.
+    A miss calls ``check`` on the invariant passed in. Only plain
+    ``LovesProofInvariant`` instances are accepted, because the key cannot see a
+    subclass's behaviour or extra state.
+
+    Because of the memoization, a repeated identical check is never re-executed,
+    whether in the same test or in another one. Call ``invariant.check`` directly
+    when the point of a test is to run the check again.
+    """
+    cache: dict[tuple[Any, ...], dict[str, Any]] = {}
+
+    def check(
+        invariant: LovesProofInvariant,
+        t: np.ndarray,
+        c: np.ndarray,
+        s: np.ndarray,
+        x: np.ndarray,
+        dtype: npt.DTypeLike = np.float64,
+    ) -> dict[str, Any]:
+        assert (
+            type(invariant) is LovesProofInvariant
+        ), f"cached_check only memoizes LovesProofInvariant, got {type(invariant).__name__}"
+        params = (invariant.eps, invariant.alpha, invariant.min_window, invariant.require_dc_trend)
+        key = (params, *(_array_key(a, dtype) for a in (t, c, s, x)))
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = invariant.check(t, c, s, x, dtype=dtype)
+        return dict(result)
+
+    return check
+
+
+@pytest.fixture(scope="session")
+def t_0_10_100() -> np.ndarray:
+    """The shared ``np.linspace(0, 10, 100)`` time grid, read-only so no test can mutate it."""
+    t = np.linspace(0, 10, 100)
+    t.setflags(write=False)
+    return t
+
+
+def _make_loves_signal(
+    t: np.ndarray,
+    *,
+    c0: float,
+    c_amp: float,
+    tau: float,
+    s0: float,
+    s_amp: float,
+    x0: float,
+    amp0: float,
+    amp_rise: float,
+    x_period: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    t_rel = t - t[0]
+    ramp = t_rel / t_rel[-1]
+
+    # c = c0 + c_amp * (1 - exp(-t / tau)), saturating coherence growth
+    c = np.exp(-t_rel / tau)
+    c *= -c_amp
+    c += c0 + c_amp
+
+    # s = s0 - s_amp * ramp, linear stress decline
+    s = ramp * -s_amp
+    s += s0
+
+    # x = x0 + (amp0 + amp_rise * ramp) * sin(2 pi t / x_period), AC with a ramped envelope
+    x = np.sin((2 * np.pi / x_period) * t_rel)
+    x *= amp0 + amp_rise * ramp
+    x += x0
+    return c, s, x
+
+
+@pytest.fixture(scope="session")
+def loves_signal() -> Callable[..., tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Builder for the saturating-coherence / linear-stress / enveloped-AC test series."""
+    return _make_loves_signal
@@ -1,9 +1,13 @@
+from collections.abc import Callable
+
 import numpy as np
 
 from harmony.invariants.loves_proof import LovesProofInvariant
 
 
-def test_counterexample_order_increase_via_reactive_forcing_fails_loves_proof() -> None:
+def test_counterexample_order_increase_via_reactive_forcing_fails_loves_proof(
+    loves_signal: Callable[..., tuple[np.ndarray, np.ndarray, np.ndarray]],
+) -> None:
     """
     Coherence increases and stress decreases, but reactive influence energy ramps up.
     Love's Proof should fail due to increasing AC power.
@@ -12,11 +16,18 @@ def test_counterexample_order_increase_via_reactive_forcing_fails_loves_proof()
 
     t = np.linspace(0, 60, 600)
 
-    c = 0.15 + 0.75 * (1 - np.exp(-t / 18))
-    s = 1.0 - 0.6 * (t / t[-1])
-
-    amp = 0.01 + 0.25 * (t / t[-1])
-    x = 0.1 + amp * np.sin(2 * np.pi * t / 2.5)
+    c, s, x = loves_signal(
+        t,
+        c0=0.15,
+        c_amp=0.75,
+        tau=18,
+        s0=1.0,
+        s_amp=0.6,
+        x0=0.1,
+        amp0=0.01,
+        amp_rise=0.25,
+        x_period=2.5,
+    )
 
     out = inv.check(t=t, c=c, s=s, x=x)
 
@@ -11,6 +11,17 @@ def test_ema_lpf_and_split_empty() -> None:
     assert ac.size == 0
 
 
+def test_acdc_split_batches_along_last_axis() -> None:
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((4, 100))
+    dc, ac = acdc_split(x, alpha=0.05)
+    for row, row_dc, row_ac in zip(x, dc, ac):
+        expected_dc, expected_ac = acdc_split(row, alpha=0.05)
+        np.testing.assert_allclose(row_dc, expected_dc, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(row_ac, expected_ac, rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(dc[:, 0], x[:, 0])
+
+
 def test_ac_power_and_trend_small() -> None:
     assert ac_power(np.array([])) == 0.0
     assert ac_power_trend(np.array([1.0, 2.0, 3.0]), np.array([0.0, 1.0, 2.0])) == 0.0
@@ -96,3 +96,18 @@ def test_consent_audit():
 
     bob_actions = cm.audit_consent_changes("bob")
     assert len(bob_actions) == 2
+
+
+def test_consent_audit_preserves_order_and_self_consent():
+    """Audit returns actions in history order, listing self-consent once."""
+    cm = ConsentManager()
+
+    cm.grant_consent("alice", "bob", "action1")
+    cm.grant_consent("alice", "alice", "action2")
+    cm.revoke_consent("bob", "alice", "action1")
+    cm.grant_consent("bob", "charlie", "action3")
+
+    history = cm.get_history()
+    assert cm.audit_consent_changes("alice") == history[:3]
+    assert cm.audit_consent_changes("charlie") == [history[3]]
+    assert cm.audit_consent_changes("dave") == []
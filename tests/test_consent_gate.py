@@ -4,6 +4,19 @@ import numpy as np
 
 from heart_field.core.entrainment import EntrainmentMetrics
 
+# Fixed stimulus for the revocable-entrainment test: the receiver starts detuned (1.2 Hz)
+# and locks onto the 1.0 Hz source halfway through. Built once at import.
+_FS = 250.0
+_T = np.arange(0, 10, 1 / _FS)
+_HALF = len(_T) // 2
+PHASE_SOURCE = 2 * np.pi * 1.0 * _T
+PHASE_RECEIVER = np.empty_like(_T)
+np.multiply(_T[:_HALF], 2 * np.pi * 1.2, out=PHASE_RECEIVER[:_HALF])
+np.multiply(_T[_HALF:], 2 * np.pi * 1.0, out=PHASE_RECEIVER[_HALF:])
+PHASE_RECEIVER[_HALF:] += 0.5
+PHASE_SOURCE.setflags(write=False)
+PHASE_RECEIVER.setflags(write=False)
+
 
 class TestConsentGate(unittest.TestCase):
     def setUp(self) -> None:
@@ -46,16 +59,8 @@ class TestConsentGate(unittest.TestCase):
         self.assertLessEqual(lock, 0.8)
 
     def test_revocable_entrainment_integration(self) -> None:
-        fs = 250.0
-        t = np.arange(0, 10, 1 / fs)
-
-        phase_source = 2 * np.pi * 1.0 * t
-
-        phase_receiver = 2 * np.pi * 1.2 * t[: len(t) // 2]
-        phase_receiver = np.concatenate([phase_receiver, 2 * np.pi * 1.0 * t[len(t) // 2 :] + 0.5])
-
         results = self.entrainment.revocable_entrainment(
-            phase_source, phase_receiver, stress_receiver=0.3
+            PHASE_SOURCE, PHASE_RECEIVER, stress_receiver=0.3
         )
 
         expected_keys = [
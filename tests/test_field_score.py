@@ -1,11 +1,14 @@
+import json
 import unittest
 
 from heart_field.core.field_score import HeartFieldScorer
 
 
 class TestHeartFieldScorer(unittest.TestCase):
-    def setUp(self) -> None:
-        self.scorer = HeartFieldScorer()
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The scorer is stateless across calls; build it (and its stress filters) once.
+        cls.scorer = HeartFieldScorer()
 
     def test_compute_net_field_basic(self) -> None:
         results = self.scorer.compute_net_field(
@@ -51,6 +54,45 @@ class TestHeartFieldScorer(unittest.TestCase):
         self.assertIn("respiration", results["plv_contributions"])
         self.assertEqual(results["plv_contributions"]["respiration"]["weight"], 0.8)
 
+    def test_plv_contributions_records(self) -> None:
+        results = self.scorer.compute_net_field(
+            heart_amplitude=1.0,
+            heart_coherence=1.0,
+            plv_dict={"respiration": 0.7, "ppg": 0.6},
+        )
+
+        contributions = results["plv_contributions"]
+        self.assertIsInstance(contributions, dict)
+        self.assertEqual(list(contributions), ["respiration", "ppg"])
+        self.assertEqual(
+            contributions["ppg"],
+            {"plv": 0.6, "weight": 0.3, "contribution": 0.6**0.3},
+        )
+        self.assertEqual(json.loads(json.dumps(contributions))["respiration"]["weight"], 0.4)
+
+        records = results["plv_records"]
+        self.assertEqual(records["weight"].tolist(), [0.4, 0.3])
+        self.assertAlmostEqual(records["contribution"].prod(), results["plv_product"])
+
+    def test_compute_net_field_vec_matches_dict_form(self) -> None:
+        results = self.scorer.compute_net_field(
+            heart_amplitude=2.0,
+            heart_coherence=0.8,
+            plv_dict={"respiration": 0.7, "ppg": 0.0},
+            distance=2.0,
+        )
+        records = results["plv_records"]
+
+        net_field_scaled = self.scorer.compute_net_field_vec(
+            2.0,
+            0.8,
+            records["plv"],
+            records["weight"],
+            distance=2.0,
+        )
+
+        self.assertAlmostEqual(net_field_scaled, results["net_field_scaled"], places=12)
+
 
 if __name__ == "__main__":
     unittest.main()
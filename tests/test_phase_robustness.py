@@ -62,6 +62,16 @@ class TestPhaseRobustness(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0], 0.0)
 
+    def test_detrending_accepts_lists(self) -> None:
+        analytic = AnalyticSignal(fs=250.0)
+
+        phase = [0.0, 1.0, 2.0, 3.1]
+        expected = analytic.remove_linear_trend(np.array(phase))
+        np.testing.assert_allclose(analytic.remove_linear_trend(phase), expected)
+        np.testing.assert_allclose(
+            analytic.remove_linear_trend(phase, [0.0, 0.004, 0.008, 0.012]), expected
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
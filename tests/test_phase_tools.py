@@ -36,6 +36,13 @@ def test_remove_linear_phase_trend_edges() -> None:
     assert abs(slope) < 1e-12
 
 
+def test_remove_linear_phase_trend_accepts_lists() -> None:
+    phase = [0.0, 1.0, 2.0, 3.1]
+    expected = remove_linear_phase_trend(np.array(phase))
+    assert np.allclose(remove_linear_phase_trend(phase), expected)
+    assert np.allclose(remove_linear_phase_trend(phase, [0, 1, 2, 3]), expected)
+
+
 def test_phase_concentration_and_plv() -> None:
     phase = np.zeros(100)
     assert compute_phase_concentration(phase) == 1.0
@@ -54,17 +61,37 @@ def test_bias_corrected_plv() -> None:
     phase1 = np.random.uniform(0, 2 * np.pi, 50)
     phase2 = np.random.uniform(0, 2 * np.pi, 50)
 
-    raw = bias_corrected_plv(phase1, phase2, n_shuffles=100)
+    raw = bias_corrected_plv(phase1, phase2, n_shuffles=100, random_state=0)
     direct = compute_phase_lock_value(phase1, phase2)
     assert raw == direct
 
     phase1 = np.random.uniform(0, 2 * np.pi, 200)
     phase2 = np.random.uniform(0, 2 * np.pi, 200)
     raw = compute_phase_lock_value(phase1, phase2)
-    corrected = bias_corrected_plv(phase1, phase2, n_shuffles=10)
+    corrected = bias_corrected_plv(phase1, phase2, n_shuffles=10, random_state=0)
     assert 0.0 <= corrected <= raw
 
 
+def test_bias_corrected_plv_random_state_is_reproducible() -> None:
+    rng = np.random.default_rng(0)
+    phase1 = rng.uniform(0, 2 * np.pi, 200)
+    phase2 = phase1 + 0.3 * rng.standard_normal(200)
+
+    seeded = bias_corrected_plv(phase1, phase2, n_shuffles=20, random_state=7)
+    assert bias_corrected_plv(phase1, phase2, n_shuffles=20, random_state=7) == seeded
+
+    from_generator = bias_corrected_plv(
+        phase1, phase2, n_shuffles=20, random_state=np.random.default_rng(7)
+    )
+    assert from_generator == seeded
+
+    gen_a = np.random.default_rng(11)
+    gen_b = np.random.default_rng(11)
+    first = bias_corrected_plv(phase1, phase2, n_shuffles=20, random_state=gen_a)
+    assert bias_corrected_plv(phase1, phase2, n_shuffles=20, random_state=gen_b) == first
+    assert gen_a.bit_generator.state == gen_b.bit_generator.state
+
+
 def test_compute_coherence_gain_rate() -> None:
     t = np.linspace(0, 5, 200)
     c = 0.1 * np.exp(0.3 * t)
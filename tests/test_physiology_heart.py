@@ -9,6 +9,7 @@ from harmony.physiology.heart import (
     SignalPreprocessor,
     StressIndexBuilder,
 )
+from harmony.physiology.shared import StreamingStats
 
 
 def test_preprocessing_and_amplitude() -> None:
@@ -146,3 +147,38 @@ def test_heart_field_scoring_and_loves_proof() -> None:
     adapter = PhysiologyLovesProof(fs=fs)
     result = adapter.check_heart_field(t, coherence, stress, heart_amplitude=heart_amp)
     assert "invariant_holds" in result
+
+
+def test_streaming_stats_matches_batch_and_feeds_scorer() -> None:
+    rng = np.random.default_rng(0)
+    amplitude = rng.standard_normal(1000)
+    coherence = rng.uniform(0.2, 0.8, 1000)
+
+    amp_stats = StreamingStats()
+    coh_stats = StreamingStats(tail_size=100)
+    for start in range(0, 1000, 37):
+        amp_stats.push(amplitude[start : start + 37])
+        coh_stats.push(coherence[start : start + 37])
+
+    assert amp_stats.count == 1000
+    assert np.isclose(amp_stats.std(), np.std(amplitude))
+    assert np.isclose(coh_stats.tail_mean(), np.mean(coherence[-100:]))
+
+    scorer = HeartFieldScorer(enable_loves_proof=False)
+    streamed = scorer.compute_with_loves_proof(
+        t=np.arange(1000) / 250.0,
+        heart_coherence=coherence,
+        stress_proxy=np.zeros(1000),
+        heart_amplitude=amplitude,
+        plv_dict={"respiration": 0.7},
+        amplitude_stats=amp_stats,
+        coherence_stats=coh_stats,
+    )
+    direct = scorer.compute_with_loves_proof(
+        t=np.arange(1000) / 250.0,
+        heart_coherence=coherence,
+        stress_proxy=np.zeros(1000),
+        heart_amplitude=amplitude,
+        plv_dict={"respiration": 0.7},
+    )
+    assert np.isclose(streamed["field_score"]["net_field"], direct["field_score"]["net_field"])
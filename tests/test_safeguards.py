@@ -1,4 +1,8 @@
+import time
+from datetime import datetime, timedelta
+
 import numpy as np
+import pytest
 
 from harmony.safeguards.boundary import BoundaryEnforcer, BoundaryGuard
 from harmony.safeguards.drift_detection import (
@@ -67,6 +71,19 @@ def test_witness_projection_and_registry() -> None:
     assert projected is not None
     assert projected.shape == (2,)
 
+    batch = np.arange(12, dtype=np.float64).reshape(3, 4)
+    assert projection.project_batch(batch, consent=False) is None
+    batched = projection.project_batch(batch, consent=True)
+    assert batched is not None
+    assert np.allclose(batched, [projection.project(row, consent=True) for row in batch])
+
+    projection32 = WitnessProjection(source_dim=4, target_dim=2, seed=1, dtype=np.float32)
+    projected32 = projection32.project(state, consent=True)
+    assert projected32 is not None
+    assert projected32.dtype == np.float32
+    assert np.allclose(projected32, projected, atol=1e-6)
+
+    assert np.allclose(projection.projection_matrix @ projection.projection_matrix.T, np.eye(2))
     assert projection.is_invertible() is False
     assert projection.information_loss() == 0.5
 
@@ -80,13 +97,42 @@ def test_witness_projection_and_registry() -> None:
     assert witnessed is not None
 
     assert registry.get_consented_witnesses("alice") == ["bob"]
+
+    carol = WitnessProjection(source_dim=4, target_dim=3, seed=2)
+    registry.register_projection("alice", "carol", carol, consent=True)
+    registry.register_projection("alice", "dave", WitnessProjection(4, 1, seed=3))
+    witnessed_all = registry.witness_all("alice", state)
+    assert list(witnessed_all) == ["bob", "carol"]
+    assert np.allclose(witnessed_all["bob"], witnessed)
+    assert np.allclose(witnessed_all["carol"], carol.project(state, consent=True))
+    assert registry.revoke_witness_consent("alice", "carol") is True
+    assert list(registry.witness_all("alice", state)) == ["bob"]
     assert registry.revoke_witness_consent("alice", "bob") is True
 
 
+def test_witness_all_without_consented_witnesses_accepts_any_dimension() -> None:
+    registry = WitnessRegistry()
+
+    assert registry.witness_all("alice", np.ones(4)) == {}
+    assert registry.witness_all("alice", np.ones(6)) == {}
+
+    registry.register_projection("alice", "bob", WitnessProjection(4, 2, seed=1))
+    assert registry.witness_all("alice", np.ones(6)) == {}
+
+
+def test_witness_all_rejects_mismatched_source_dimensions() -> None:
+    registry = WitnessRegistry()
+    registry.register_projection("alice", "bob", WitnessProjection(4, 2, seed=1), consent=True)
+    registry.register_projection("alice", "carol", WitnessProjection(6, 2, seed=2), consent=True)
+
+    with pytest.raises(ValueError, match=r"State dimension \(4\) does not match source \(6\)"):
+        registry.witness_all("alice", np.ones(4))
+
+
 def test_drift_detectors() -> None:
     detector = DriftDetector(threshold=0.1)
     event = DriftEvent(
-        timestamp=__import__("datetime").datetime.now(),
+        timestamp_ns=time.time_ns(),
         drift_type="phase",
         magnitude=0.2,
         threshold=0.1,
@@ -120,3 +166,66 @@ def test_drift_detectors() -> None:
     drifted, magnitude = role_detector.check_drift(np.ones(3), source="z")
     assert drifted is True
     assert magnitude > 0
+
+
+def test_drift_histories_are_bounded() -> None:
+    phase_detector = PhaseDriftDetector(threshold=0.5, window_size=5)
+    for value in np.linspace(0.1, 0.9, 20):
+        phase_detector.check_drift(float(value))
+    assert len(phase_detector._coherence_history) == 5
+    assert phase_detector.get_coherence_trend() == "improving"
+
+    boundary_detector = BoundaryDriftDetector(threshold=0.5, window_size=5)
+    for value in np.linspace(0.9, 0.8, 50):
+        boundary_detector.check_drift(float(value))
+    assert len(boundary_detector._boundary_history) == 5
+
+
+def test_drift_event_store_grows_and_filters() -> None:
+    detector = DriftDetector(threshold=0.1)
+    start = datetime(2024, 1, 1)
+    for i in range(40):
+        detector.record_event(
+            DriftEvent(
+                timestamp_ns=(int(start.timestamp()) + i) * 1_000_000_000,
+                drift_type="phase" if i % 2 else "role",
+                magnitude=0.1 * i,
+                threshold=0.1,
+                source=f"s{i}",
+            )
+        )
+
+    assert len(detector.get_events()) == 40
+    phase_events = detector.get_events(drift_type="phase")
+    assert [e.source for e in phase_events] == [f"s{i}" for i in range(1, 40, 2)]
+    recent = detector.get_events(drift_type="role", since=start + timedelta(seconds=30))
+    assert [e.source for e in recent] == ["s30", "s32", "s34", "s36", "s38"]
+    assert recent[0].timestamp == start + timedelta(seconds=30)
+    assert detector.get_events(drift_type="boundary") == []
+    assert len(detector.get_events(since=time.time_ns())) == 0
+
+
+def test_role_state_history_is_circular() -> None:
+    role_detector = RoleDriftDetector(threshold=10.0, window_size=3)
+    assert role_detector.get_state_history().shape == (0, 0)
+
+    for i in range(5):
+        role_detector.check_drift(np.full(2, float(i)))
+
+    history = role_detector.get_state_history()
+    assert history.shape == (3, 2)
+    assert np.array_equal(history[:, 0], [2.0, 3.0, 4.0])
+
+
+def test_phase_drift_adwin_detects_mean_shift() -> None:
+    rng = np.random.default_rng(0)
+    detector = PhaseDriftDetector(window_size=200, method="adwin")
+
+    for value in 0.8 + 0.02 * rng.standard_normal(300):
+        drifted, _ = detector.check_drift(float(value))
+        assert drifted is False
+
+    shifted = [detector.check_drift(float(v))[0] for v in 0.3 + 0.02 * rng.standard_normal(300)]
+    assert any(shifted)
+    event = detector.get_events(drift_type="phase")[0]
+    assert event.magnitude > event.threshold
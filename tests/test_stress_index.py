@@ -39,6 +39,24 @@ class TestStressIndexBuilder(unittest.TestCase):
         self.assertEqual(len(time_points), len(stress_values))
         self.assertIsInstance(component_history, dict)
 
+    def test_compute_stress_timeseries_threaded_matches_serial(self) -> None:
+        builder = StressIndexBuilder(fs=250.0, method="standard")
+        rng = np.random.default_rng(0)
+        signals = {
+            "heart_rate": 60.0 + rng.standard_normal(7500),
+            "eda_signal": rng.standard_normal(7500) * 0.1,
+            "rr_intervals": 1.0 + 0.05 * rng.standard_normal(7500),
+        }
+
+        serial = builder.compute_stress_timeseries(signals, window_sec=10.0, step_sec=5.0)
+        threaded = builder.compute_stress_timeseries(
+            signals, window_sec=10.0, step_sec=5.0, n_jobs=4
+        )
+
+        np.testing.assert_array_equal(serial[0], threaded[0])
+        np.testing.assert_array_equal(serial[1], threaded[1])
+        self.assertEqual(serial[2], threaded[2])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,76 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "verify_ethics.py"
+_spec = importlib.util.spec_from_file_location("verify_ethics", _SCRIPT)
+assert _spec is not None and _spec.loader is not None
+verify_ethics = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(verify_ethics)
+
+
+def _consent_bypass_lines(tmp_path: Path, source: str) -> list[int]:
+    path = tmp_path / "probe.py"
+    path.write_text(source)
+    verifier = verify_ethics.EthicsVerifier()
+    verifier.verify_file(path)
+    return [v.line_number for v in verifier.violations if v.violation_type == "CONSENT_BYPASS"]
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "consent_required = False\n",
+        "consent_required: bool = False\n",
+        "self.consent_required = False\n",
+        "configure(consent_required=False)\n",
+        "def f(consent_required=False):\n    pass\n",
+        "def f(a, /, consent_required=False):\n    pass\n",
+        "def f(consent_required=False, /):\n    pass\n",
+        "def f(*, consent_required=False):\n    pass\n",
+        "f = lambda consent_required=False: None\n",
+    ],
+    ids=[
+        "assign",
+        "annotated_assign",
+        "attribute_assign",
+        "keyword_argument",
+        "parameter_default",
+        "positional_or_keyword_after_posonly",
+        "positional_only_default",
+        "keyword_only_default",
+        "lambda_default",
+    ],
+)
+def test_consent_required_false_is_flagged(tmp_path: Path, source: str) -> None:
+    assert _consent_bypass_lines(tmp_path, source) == [1]
+
+
+def test_consent_required_defaults_are_paired_with_their_parameters(tmp_path: Path) -> None:
+    source = (
+        "def f(consent_required, verbose=False, *, strict=False, other=True):\n"
+        "    pass\n"
+        "def g(consent_required=True):\n"
+        "    pass\n"
+        "def h(a, consent_required=False, *, b=1):\n"
+        "    pass\n"
+    )
+
+    assert _consent_bypass_lines(tmp_path, source) == [5]
+
+
+def test_backward_calls_honour_line_exemptions(tmp_path: Path) -> None:
+    path = tmp_path / "probe.py"
+    path.write_text(
+        "loss.backward()\n"
+        "loss.backward()  # PROHIBITED: shown as what not to do\n"
+        "x = 1\n"
+        "loss.backward()  # Example of violation\n"
+        "other.backward()\n"
+    )
+    verifier = verify_ethics.EthicsVerifier()
+    verifier.verify_file(path)
+
+    lines = sorted(v.line_number for v in verifier.violations if v.violation_type == "COERCION")
+    assert lines == [1, 5]